@@ -34,6 +34,11 @@ class FlowMetricsDataExtractor:
             elif 'internal_kpis' in source_file:
                 data_points.extend(self._extract_team_points(data, source_api))
         
+        # Precompute lowercased text once per point for downstream relevance scoring
+        for point in data_points:
+            point['_content_lower'] = point['content'].lower()
+            point['_tag_lower_joined'] = ' '.join(point['tags']).lower()
+        
         print(f"📋 Extracted {len(data_points)} data points")
         return data_points
     
@@ -390,8 +390,11 @@ class EnhancedGraphVisualizer:
         
         return self.create_interactive_network(subgraph, title, audience)
 
-    def create_interactive_network(self, graph: nx.Graph, title: str, audience: str = None):
-        """Create interactive network visualization with enhanced styling"""
+    def create_interactive_network(self, graph: nx.Graph, title: str, audience: str = None, pos: dict = None):
+        """Create interactive network visualization with enhanced styling
+        
+        Pass precomputed `pos` (e.g. a layout of the full graph) to skip the spring layout.
+        """
         if len(graph.nodes()) == 0:
             return go.Figure().add_annotation(
                 text=f"No relevant data found for {audience or 'this filter'}",
@@ -400,7 +403,8 @@ class EnhancedGraphVisualizer:
             )
         
         # Generate layout with better spacing
-        pos = nx.spring_layout(graph, k=3, iterations=100)
+        if pos is None:
+            pos = nx.spring_layout(graph, k=3, iterations=100)
         
         # Create edge traces by relationship type
         edge_traces = self.create_enhanced_edge_traces(graph, pos)
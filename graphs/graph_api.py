@@ -3,13 +3,17 @@ FastAPI Web Service for Graph Visualization Platform
 Provides REST API endpoints similar to Linkurious functionality
 """
 
-from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+from itertools import islice
 import json
+import orjson
 import logging
 import asyncio
 from datetime import datetime
@@ -25,7 +29,9 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Agentic Commerce Graph Visualization API",
     description="Professional graph visualization platform inspired by Linkurious",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson encodes the large graph payloads several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for frontend integration
@@ -37,9 +43,70 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JS/CSS/JSON responses for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# Browser cache lifetime for /static assets (StaticFiles already adds ETag/Last-Modified)
+STATIC_MAX_AGE = 3600
+
+@app.middleware("http")
+async def cache_static_assets(request: Request, call_next):
+    """Let browsers reuse static assets across page loads"""
+    response = await call_next(request)
+    if request.url.path.startswith("/static/"):
+        response.headers.setdefault("Cache-Control", f"public, max-age={STATIC_MAX_AGE}")
+    return response
+
 # Global Neo4j client
 neo4j_client: Optional[Neo4jGraphClient] = None
 
+# Set by start_server for multi-worker runs, where the data is loaded once before the workers start
+SKIP_STARTUP_INGEST_ENV = "GRAPH_API_SKIP_STARTUP_INGEST"
+
+# Characters of node content sent in compact graph payloads (the UI labels only show ~30)
+CONTENT_PREVIEW_CHARS = 50
+
+def enum_code(codes: Dict[str, int], value: Optional[str]) -> int:
+    """Code of `value` in a per-response enum, assigned on first sight (-1 for missing values)"""
+    if value is None:
+        return -1
+    return codes.setdefault(value, len(codes))
+
+def payload_enums(type_codes: Dict[str, int], source_codes: Dict[str, int]) -> Dict[str, List[str]]:
+    """Type/source lists a compact payload's codes index into (codes follow insertion order)"""
+    return {'types': list(type_codes), 'sources': list(source_codes)}
+
+def compact_node(node: Dict, type_codes: Dict[str, int], source_codes: Dict[str, int]) -> Dict:
+    """Truncated content and integer type/source codes instead of the full node (new values extend the code maps)"""
+    content = node.get('content') or ''
+    return {
+        'id': node['id'],
+        'content': content[:CONTENT_PREVIEW_CHARS],
+        'content_truncated': len(content) > CONTENT_PREVIEW_CHARS,
+        'type_code': enum_code(type_codes, node.get('type')),
+        'source_code': enum_code(source_codes, node.get('source')),
+        'confidence': node.get('confidence'),
+        'value': node.get('value'),
+        'tags': node.get('tags'),
+        'x': node.get('x'),
+        'y': node.get('y')
+    }
+
+def compact_edge(edge: Dict) -> Dict:
+    """Edge without its metadata blob"""
+    return {k: v for k, v in edge.items() if k != 'metadata_json'}
+
+def compact_graph(graph_data: Dict) -> Dict:
+    """Shrink a graph payload: truncated content, integer type/source codes, no metadata blobs
+    
+    The type/source enums are built from the payload's own nodes and shipped with it, so they cost no
+    extra query and stay valid after a re-ingest.
+    """
+    type_codes, source_codes = {}, {}
+    nodes = [compact_node(node, type_codes, source_codes) for node in graph_data['nodes']]
+    edges = [compact_edge(edge) for edge in graph_data['edges']]
+    return {**graph_data, 'nodes': nodes, 'edges': edges, 'enums': payload_enums(type_codes, source_codes)}
+
 # Pydantic models for API requests
 class GraphFilterRequest(BaseModel):
     node_types: Optional[List[str]] = None
@@ -48,6 +115,8 @@ class GraphFilterRequest(BaseModel):
     min_weight: float = 0.3
     tags: Optional[List[str]] = None
     limit: int = 100
+    # Compact payload: content preview, type/source as codes into the payload's enums, no JSON blobs
+    compact: bool = False
 
 class SearchRequest(BaseModel):
     query: str
@@ -83,6 +152,19 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+def ensure_graph_loaded(client: Neo4jGraphClient) -> Dict:
+    """Load the bundled graph data if the database is empty; returns the graph overview"""
+    overview = client.get_graph_overview()
+    if overview['total_nodes'] == 0:
+        logger.info("📥 Loading initial graph data...")
+        client.load_nodes_from_json('nodes/flowmetrics_nodes.json')
+        client.load_edges_from_json('edges/flowmetrics_edges.json')
+        overview = client.get_graph_overview()
+    else:
+        # Existing graphs may predate the flattened audience scores the audience views query
+        client.backfill_audience_scores()
+    return overview
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -95,12 +177,10 @@ async def startup_event():
         neo4j_client = Neo4jGraphClient()
         
         # Check if data exists, if not load it
-        overview = neo4j_client.get_graph_overview()
-        if overview['total_nodes'] == 0:
-            logger.info("📥 Loading initial graph data...")
-            neo4j_client.load_nodes_from_json('nodes/flowmetrics_nodes.json')
-            neo4j_client.load_edges_from_json('edges/flowmetrics_edges.json')
+        if os.environ.get(SKIP_STARTUP_INGEST_ENV):
             overview = neo4j_client.get_graph_overview()
+        else:
+            overview = ensure_graph_loaded(neo4j_client)
         
         logger.info(f"✅ Graph ready: {overview['total_nodes']} nodes, {overview['total_relationships']} relationships")
         
@@ -172,6 +252,37 @@ async def search_nodes(request: SearchRequest):
         logger.error(f"Search failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def graph_filters(request: GraphFilterRequest) -> Dict:
+    """Client keyword arguments for a graph filter request"""
+    return {
+        'node_types': request.node_types,
+        'sources': request.sources,
+        'min_confidence': request.min_confidence,
+        'min_weight': request.min_weight,
+        'tags': request.tags,
+        'limit': request.limit
+    }
+
+async def broadcast_filter_activity(request: GraphFilterRequest, results_count: int):
+    """Tell connected clients about a graph filter request"""
+    await manager.broadcast({
+        "type": "filter_activity",
+        "filters": request.dict(),
+        "results_count": results_count,
+        "timestamp": datetime.now().isoformat()
+    })
+
+async def load_filtered_graph(request: GraphFilterRequest) -> Dict:
+    """Run a graph filter request and broadcast it to connected clients"""
+    graph_data = neo4j_client.get_filtered_graph(**graph_filters(request))
+    if request.compact:
+        graph_data = compact_graph(graph_data)
+    
+    # Broadcast filter activity
+    await broadcast_filter_activity(request, graph_data['total_nodes'])
+    
+    return graph_data
+
 @app.post("/api/graph/filtered")
 async def get_filtered_graph(request: GraphFilterRequest):
     """Get filtered graph data for visualization"""
@@ -179,28 +290,79 @@ async def get_filtered_graph(request: GraphFilterRequest):
         raise HTTPException(status_code=500, detail="Neo4j client not initialized")
     
     try:
-        graph_data = neo4j_client.get_filtered_graph(
-            node_types=request.node_types,
-            sources=request.sources,
-            min_confidence=request.min_confidence,
-            min_weight=request.min_weight,
-            tags=request.tags,
-            limit=request.limit
-        )
-        
-        # Broadcast filter activity
-        await manager.broadcast({
-            "type": "filter_activity",
-            "filters": request.dict(),
-            "results_count": graph_data['total_nodes'],
-            "timestamp": datetime.now().isoformat()
-        })
-        
-        return graph_data
+        return await load_filtered_graph(request)
     except Exception as e:
         logger.error(f"Filtered graph failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Rows pulled from the Neo4j cursor per chunk (and sent between client-disconnect checks) while streaming NDJSON
+NDJSON_CHUNK_ROWS = 200
+
+def next_rows(rows: Iterator[Tuple[str, Dict]]) -> List[Tuple[str, Dict]]:
+    """Pull the next chunk of rows from a blocking result cursor"""
+    return list(islice(rows, NDJSON_CHUNK_ROWS))
+
+async def graph_ndjson(request: GraphFilterRequest, meta: Dict, rows: Iterator[Tuple[str, Dict]],
+                       chunk: List[Tuple[str, Dict]], http_request: Request):
+    """Yield a graph as NDJSON straight off the cursor: a meta line, one line per node and edge, then the totals
+    
+    Compact enums are only complete once every node was seen, so they travel in the closing meta line.
+    """
+    type_codes, source_codes = {}, {}
+    counts = {'node': 0, 'edge': 0}
+    try:
+        yield orjson.dumps({'kind': 'meta', **meta}) + b"\n"
+        while chunk:
+            # Stop querying and serialising for clients that aborted (e.g. superseded by a newer filter)
+            if await http_request.is_disconnected():
+                return
+            for kind, item in chunk:
+                if request.compact:
+                    item = compact_node(item, type_codes, source_codes) if kind == 'node' else compact_edge(item)
+                counts[kind] += 1
+                yield orjson.dumps({'kind': kind, **item}) + b"\n"
+            chunk = await run_in_threadpool(next_rows, rows)
+    finally:
+        # Releases the session, also when the client went away mid-stream
+        await run_in_threadpool(rows.close)
+    
+    totals = {'total_nodes': counts['node'], 'total_edges': counts['edge']}
+    if request.compact:
+        totals['enums'] = payload_enums(type_codes, source_codes)
+    yield orjson.dumps({'kind': 'meta', **totals}) + b"\n"
+    await broadcast_filter_activity(request, counts['node'])
+
+@app.post("/api/graph/filtered/stream")
+async def stream_filtered_graph(request: GraphFilterRequest, http_request: Request):
+    """Filtered graph as NDJSON, streamed from the Neo4j cursor so the client can parse it while it downloads"""
+    if not neo4j_client:
+        raise HTTPException(status_code=500, detail="Neo4j client not initialized")
+    
+    filters = graph_filters(request)
+    meta = {'filters_applied': {k: v for k, v in filters.items() if k != 'limit'}}
+    try:
+        rows = neo4j_client.iter_filtered_graph(**filters)
+        # The first chunk is pulled before responding, so query errors still surface as a 500
+        chunk = await run_in_threadpool(next_rows, rows)
+    except Exception as e:
+        logger.error(f"Filtered graph stream failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(graph_ndjson(request, meta, rows, chunk, http_request),
+                             media_type="application/x-ndjson")
+
+@app.get("/api/enums")
+async def get_enums():
+    """Distinct node types and sources in the graph"""
+    if not neo4j_client:
+        raise HTTPException(status_code=500, detail="Neo4j client not initialized")
+    
+    try:
+        return neo4j_client.get_node_enums()
+    except Exception as e:
+        logger.error(f"Get enums failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/graph/audience/{audience}")
 async def get_audience_graph(audience: str, limit: int = Query(100, ge=1, le=500)):
     """Get audience-focused graph (investors, customers, etc.)"""
@@ -355,10 +517,26 @@ async def websocket_endpoint(websocket: WebSocket):
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Development server function
-def start_server():
-    """Start the development server"""
+def start_server(reload: bool = True, workers: int = 1):
+    """Start the server (auto-reloading for development)
+    
+    `workers` > 1 is opt-in and incompatible with the WebSocket features: each worker keeps its own
+    connection list, so collaboration broadcasts only reach clients on the same worker.
+    """
     import uvicorn
     
+    # Reload mode is always single-process
+    workers = 1 if reload else max(1, workers)
+    if workers > 1:
+        logger.warning(f"⚠️ Running {workers} workers: real-time collaboration only reaches clients on the same worker")
+        # Load data once here rather than in every worker's startup hook
+        client = Neo4jGraphClient()
+        try:
+            ensure_graph_loaded(client)
+        finally:
+            client.close()
+        os.environ[SKIP_STARTUP_INGEST_ENV] = "1"
+    
     logger.info("🌐 Starting Graph Visualization Server...")
     logger.info("📊 Dashboard will be available at: http://localhost:8000")
     logger.info("🔍 API documentation at: http://localhost:8000/docs")
@@ -367,7 +545,11 @@ def start_server():
         "graph_api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=workers,
+        # "auto" picks uvloop and httptools when installed (uvicorn[standard]), else asyncio/h11
+        loop="auto",
+        http="auto",
         log_level="info"
     )
 
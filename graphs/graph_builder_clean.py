@@ -7,14 +7,28 @@ import json
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
-from dataclasses import dataclass, asdict
+from sklearn.feature_extraction.text import CountVectorizer
+from scipy import sparse
+from dataclasses import dataclass, fields
 from typing import List, Dict, Any, Tuple
 import networkx as nx
 import os
+import re
+import hashlib
 from datetime import datetime
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-@dataclass
+# Sentence-transformer model used for node embeddings
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Row/column block size for the tiled similarity computation
+SIMILARITY_TILE = 4096
+
+# Tiles computed at once; each holds a ~64 MB similarity block and BLAS already threads inside it
+SIMILARITY_WORKERS = 2
+
+@dataclass(slots=True)
 class GraphNode:
     """Node in the semantic graph"""
     id: str
@@ -26,10 +40,10 @@ class GraphNode:
     source: str
     tags: List[str]
     audience_relevance: Dict[str, float]
-    embedding: List[float]
+    embedding: np.ndarray  # row view into the builder's (N, D) float32 embedding matrix
     metadata: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class GraphEdge:
     """Edge connecting two nodes"""
     source_id: str
@@ -40,19 +54,36 @@ class GraphEdge:
     semantic_similarity: float
     metadata: Dict[str, Any]
 
+def _shallow_dict(obj, field_names: Tuple[str, ...]) -> Dict[str, Any]:
+    """Dataclass -> dict without asdict's deep copy (embedding arrays are reused as-is)"""
+    return {name: getattr(obj, name) for name in field_names}
+
+def _json_default(obj):
+    """json.dump hook: NumPy arrays and scalars become plain Python values"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+_NODE_FIELDS = tuple(f.name for f in fields(GraphNode))
+_EDGE_FIELDS = tuple(f.name for f in fields(GraphEdge))
+
 class FlowMetricsGraphBuilder:
     """Build semantic graph from FlowMetrics data using ML"""
     
     def __init__(self):
         print("🤖 Initializing FlowMetrics Graph Builder...")
         
-        # Initialize sentence transformer for semantic embeddings
-        self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Sentence transformer is loaded lazily, only when uncached content needs embedding
+        self._sentence_model = None
+        # One cache file per model, so switching models never reuses another model's vectors
+        self._emb_cache_path = f"graphs/cache/emb_cache_{EMBEDDING_MODEL}.npz"
         
         # Graph storage
         self.nodes: Dict[str, GraphNode] = {}
+        # (N, D) float32 embeddings, row i belonging to the i-th node in self.nodes
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        # The NetworkX graph is only materialized from these when it is actually needed
         self.edges: List[GraphEdge] = []
-        self.nx_graph = nx.Graph()
         
         # Audience definitions for relevance scoring
         self.audiences = {
@@ -73,6 +104,109 @@ class FlowMetricsGraphBuilder:
                 "interests": ["technical_updates", "integration_capabilities"]
             }
         }
+        
+        self._build_keyword_index()
+    
+    def _build_keyword_index(self) -> None:
+        """Precompute the sparse keyword vocabulary and audience mask used for relevance scoring"""
+        self._audience_names = list(self.audiences.keys())
+        self._keyword_vocab = sorted({kw for profile in self.audiences.values() for kw in profile['keywords']})
+        vocab_index = {kw: i for i, kw in enumerate(self._keyword_vocab)}
+        
+        # Keywords are matched as substrings (same semantics as the original `keyword in text`):
+        # a zero-width lookahead alternation finds overlapping hits, including multi-word keywords,
+        # in one regex pass per text instead of a Python `in` scan per keyword
+        alternation = "|".join(re.escape(kw) for kw in sorted(self._keyword_vocab, key=len, reverse=True))
+        self._keyword_vectorizer = CountVectorizer(
+            vocabulary=self._keyword_vocab,
+            binary=True,
+            lowercase=False,  # texts arrive already lowercased
+            token_pattern=f"(?=({alternation}))"
+        )
+        
+        # Audience-keyword mask, shape [A, V]
+        mask = np.zeros((len(self._audience_names), len(self._keyword_vocab)), dtype=np.float32)
+        for a, audience in enumerate(self._audience_names):
+            for kw in self.audiences[audience]['keywords']:
+                mask[a, vocab_index[kw]] = 1.0
+        self._audience_mask = sparse.csr_matrix(mask)
+        self._keyword_counts = np.array(
+            [len(self.audiences[audience]['keywords']) for audience in self._audience_names],
+            dtype=np.float64
+        )
+    
+    def build_nx_graph(self) -> nx.Graph:
+        """Build the NetworkX graph from the node map and edge list in bulk"""
+        G = nx.Graph()
+        
+        # Add simplified node attributes for NetworkX compatibility
+        G.add_nodes_from(
+            (node_id, {
+                'type': node.type,
+                'content': node.content[:100],  # Truncate for compatibility
+                'source': node.source,
+                'confidence': str(node.confidence),
+                'tags': ",".join(node.tags[:3])  # Limit tags for compatibility
+            })
+            for node_id, node in self.nodes.items()
+        )
+        
+        G.add_edges_from(
+            (edge.source_id, edge.target_id, {
+                'weight': edge.weight,
+                'relationship': edge.relationship_type,
+                'similarity': edge.semantic_similarity
+            })
+            for edge in self.edges
+        )
+        
+        return G
+    
+    @property
+    def sentence_model(self) -> SentenceTransformer:
+        """Sentence transformer for semantic embeddings (loaded on first use)"""
+        if self._sentence_model is None:
+            self._sentence_model = SentenceTransformer(EMBEDDING_MODEL)
+        return self._sentence_model
+    
+    @staticmethod
+    def _embedding_key(content: str) -> bytes:
+        """Stable cache key for a piece of content"""
+        return hashlib.blake2b(content.encode()).digest()[:16]
+    
+    def _load_embedding_cache(self) -> Dict[bytes, np.ndarray]:
+        """Load previously computed embeddings keyed by content hash"""
+        if not os.path.exists(self._emb_cache_path):
+            return {}
+        
+        with np.load(self._emb_cache_path) as cache:
+            return {bytes(key): emb for key, emb in zip(cache['keys'], cache['embeddings'])}
+    
+    def _save_embedding_cache(self, cache: Dict[bytes, np.ndarray]) -> None:
+        """Persist the embedding cache for incremental re-runs"""
+        os.makedirs(os.path.dirname(self._emb_cache_path), exist_ok=True)
+        keys = np.frombuffer(b"".join(cache.keys()), dtype=np.uint8).reshape(-1, 16)
+        np.savez(self._emb_cache_path, keys=keys, embeddings=np.stack(list(cache.values())))
+    
+    def embed_contents(self, contents: List[str]) -> np.ndarray:
+        """Embed contents, reusing cached embeddings and only encoding cache misses"""
+        cache = self._load_embedding_cache()
+        keys = [self._embedding_key(content) for content in contents]
+        
+        missing = {}
+        for key, content in zip(keys, contents):
+            if key not in cache:
+                missing[key] = content
+        
+        if missing:
+            print(f"🔄 Generating semantic embeddings for {len(missing)} new contents...")
+            new_embeddings = self.sentence_model.encode(list(missing.values()))
+            cache.update(zip(missing.keys(), new_embeddings))
+            self._save_embedding_cache(cache)
+        else:
+            print("♻️ All embeddings loaded from cache")
+        
+        return np.stack([cache[key] for key in keys])
     
     def load_flowmetrics_data(self) -> List[Dict]:
         """Load all FlowMetrics data files"""
@@ -101,30 +235,52 @@ class FlowMetricsGraphBuilder:
     
     def calculate_audience_relevance(self, content: str, tags: List[str]) -> Dict[str, float]:
         """Calculate relevance scores for each audience using keyword matching"""
-        relevance_scores = {}
+        return self.calculate_audience_relevance_batch([content], [tags])[0]
+    
+    def calculate_audience_relevance_batch(self, contents: List[str], tags_list: List[List[str]],
+                                           texts: List[str] = None) -> List[Dict[str, float]]:
+        """Calculate audience relevance for many data points with a single sparse matmul
         
-        # Combine content and tags for analysis
-        text_for_analysis = f"{content} {' '.join(tags)}"
-        content_lower = text_for_analysis.lower()
+        `texts` may carry the already-lowercased "content tags" strings to skip recomputing them.
+        """
+        if not contents:
+            return []
         
-        for audience, profile in self.audiences.items():
-            score = 0.0
-            
-            # Keyword matching
-            keyword_matches = sum(1 for keyword in profile['keywords'] if keyword in content_lower)
-            keyword_score = min(keyword_matches / len(profile['keywords']), 1.0)
-            
-            # Tag relevance
-            tag_relevance = 0.0
+        # Combine content and tags for analysis
+        if texts is None:
+            texts = [f"{content} {' '.join(tags)}".lower() for content, tags in zip(contents, tags_list)]
+        
+        # Keyword matching: [N, V] @ [V, A] -> matches per audience
+        X = self._keyword_vectorizer.transform(texts)
+        keyword_matches = (X @ self._audience_mask.T).toarray()
+        keyword_scores = np.minimum(keyword_matches / self._keyword_counts, 1.0)
+        
+        # Tag relevance: each distinct tag is checked against the audience interests once
+        tag_hits: Dict[str, np.ndarray] = {}
+        tag_relevance = np.zeros_like(keyword_scores)
+        for i, tags in enumerate(tags_list):
             for tag in tags:
-                if any(interest in tag for interest in profile['interests']):
-                    tag_relevance += 0.2
-            
-            # Combine scores
-            score = (keyword_score * 0.7) + (min(tag_relevance, 1.0) * 0.3)
-            relevance_scores[audience] = round(score, 3)
-        
-        return relevance_scores
+                if tag not in tag_hits:
+                    tag_hits[tag] = np.array([
+                        any(interest in tag for interest in self.audiences[audience]['interests'])
+                        for audience in self._audience_names
+                    ])
+                tag_relevance[i] += tag_hits[tag] * 0.2
+        
+        # Combine scores
+        scores = (keyword_scores * 0.7) + (np.minimum(tag_relevance, 1.0) * 0.3)
+        
+        return [
+            {audience: round(float(row[a]), 3) for a, audience in enumerate(self._audience_names)}
+            for row in scores
+        ]
+    
+    @staticmethod
+    def _analysis_text(point: Dict) -> str:
+        """Lowercased "content tags" text, using the extractor's precomputed fields when present"""
+        if '_content_lower' in point and '_tag_lower_joined' in point:
+            return f"{point['_content_lower']} {point['_tag_lower_joined']}"
+        return f"{point['content']} {' '.join(point['tags'])}".lower()
     
     def create_graph_nodes(self, data_points: List[Dict]) -> None:
         """Convert data points to graph nodes with embeddings"""
@@ -133,18 +289,21 @@ class FlowMetricsGraphBuilder:
         # Extract content for batch embedding
         contents = [point['content'] for point in data_points]
         
-        # Generate embeddings in batch for efficiency
-        print("🔄 Generating semantic embeddings...")
-        embeddings = self.sentence_model.encode(contents)
+        # Generate embeddings in batch for efficiency, reusing cached ones
+        embeddings = self.embed_contents(contents).astype(np.float32, copy=False)
+        # Nodes hold row views into the matrix, so no per-node lists are built
+        self._embeddings = np.vstack([self._embeddings, embeddings]) if len(self._embeddings) else embeddings
+        
+        # Calculate audience relevance for all points at once
+        relevances = self.calculate_audience_relevance_batch(
+            contents,
+            [point['tags'] for point in data_points],
+            [self._analysis_text(point) for point in data_points]
+        )
         
         for i, point in enumerate(data_points):
             node_id = str(uuid.uuid4())
-            
-            # Calculate audience relevance
-            audience_relevance = self.calculate_audience_relevance(
-                point['content'], 
-                point['tags']
-            )
+            audience_relevance = relevances[i]
             
             # Create node
             node = GraphNode(
@@ -157,20 +316,11 @@ class FlowMetricsGraphBuilder:
                 source=point['source'],
                 tags=point['tags'],
                 audience_relevance=audience_relevance,
-                embedding=embeddings[i].tolist(),
+                embedding=embeddings[i],
                 metadata=point['metadata']
             )
             
             self.nodes[node_id] = node
-            # Add simplified node attributes for NetworkX compatibility
-            self.nx_graph.add_node(
-                node_id, 
-                type=node.type,
-                content=node.content[:100],  # Truncate for compatibility
-                source=node.source,
-                confidence=str(node.confidence),
-                tags=",".join(node.tags[:3])  # Limit tags for compatibility
-            )
         
         print(f"✅ Created {len(self.nodes)} graph nodes")
     
@@ -178,52 +328,77 @@ class FlowMetricsGraphBuilder:
         """Calculate cosine similarity between embeddings"""
         return float(cosine_similarity([embedding1], [embedding2])[0][0])
     
+    def _similar_pairs(self, embeddings: np.ndarray, similarity_threshold: float,
+                       tile: int = SIMILARITY_TILE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find all (i < j) pairs above the threshold without materializing the full N x N matrix"""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        emb = (embeddings / np.where(norms == 0, 1, norms)).astype(np.float32)
+        n = len(emb)
+        
+        def process_tile(i: int, j: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            S = emb[i:i + tile] @ emb[j:j + tile].T
+            rows, cols = np.nonzero(S > similarity_threshold)
+            rows_g, cols_g = rows + i, cols + j
+            upper = rows_g < cols_g  # each unordered pair once, no self-loops
+            return rows_g[upper], cols_g[upper], S[rows[upper], cols[upper]]
+        
+        tiles = [(i, j) for i in range(0, n, tile) for j in range(i, n, tile)]
+        
+        # BLAS releases the GIL, so a few tiles can overlap their thresholding with the next matmul
+        with ThreadPoolExecutor(max_workers=min(SIMILARITY_WORKERS, len(tiles) or 1)) as executor:
+            results = list(executor.map(lambda ij: process_tile(*ij), tiles))
+        
+        if not results:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0, dtype=np.float32)
+        
+        rows = np.concatenate([r[0] for r in results])
+        cols = np.concatenate([r[1] for r in results])
+        sims = np.concatenate([r[2] for r in results])
+        
+        # Keep the same (i, j) ordering as a nested pairwise loop
+        order = np.lexsort((cols, rows))
+        return rows[order], cols[order], sims[order]
+    
     def create_semantic_edges(self, similarity_threshold: float = 0.3) -> None:
         """Create edges based on semantic similarity and logical relationships"""
         print("🔗 Creating semantic edges...")
         
         node_list = list(self.nodes.values())
         edge_count = 0
+        if not node_list:
+            print(f"✅ Created {edge_count} semantic edges")
+            return
         
-        for i, node1 in enumerate(node_list):
-            for j, node2 in enumerate(node_list[i+1:], i+1):
-                
-                # Calculate semantic similarity
-                similarity = self.calculate_semantic_similarity(
-                    node1.embedding, 
-                    node2.embedding
-                )
-                
-                # Determine relationship type and weight
-                relationship_type, weight, confidence = self._analyze_relationship(
-                    node1, node2, similarity
+        # Calculate semantic similarity for all pairs, tile by tile, straight from the embedding matrix
+        rows, cols, sims = self._similar_pairs(self._embeddings, similarity_threshold)
+        
+        for i, j, similarity in zip(rows.tolist(), cols.tolist(), sims.tolist()):
+            node1, node2 = node_list[i], node_list[j]
+            
+            # Determine relationship type and weight
+            relationship_type, weight, confidence = self._analyze_relationship(
+                node1, node2, similarity
+            )
+            
+            # Create edge if relationship carries weight
+            if weight > 0:
+                edge = GraphEdge(
+                    source_id=node1.id,
+                    target_id=node2.id,
+                    relationship_type=relationship_type,
+                    weight=weight,
+                    confidence=confidence,
+                    semantic_similarity=similarity,
+                    metadata={
+                        "similarity_score": similarity,
+                        "source_types": f"{node1.type}-{node2.type}",
+                        "shared_tags": list(set(node1.tags) & set(node2.tags))
+                    }
                 )
                 
-                # Create edge if similarity exceeds threshold
-                if similarity > similarity_threshold and weight > 0:
-                    edge = GraphEdge(
-                        source_id=node1.id,
-                        target_id=node2.id,
-                        relationship_type=relationship_type,
-                        weight=weight,
-                        confidence=confidence,
-                        semantic_similarity=similarity,
-                        metadata={
-                            "similarity_score": similarity,
-                            "source_types": f"{node1.type}-{node2.type}",
-                            "shared_tags": list(set(node1.tags) & set(node2.tags))
-                        }
-                    )
-                    
-                    self.edges.append(edge)
-                    self.nx_graph.add_edge(
-                        node1.id, 
-                        node2.id, 
-                        weight=weight,
-                        relationship=relationship_type,
-                        similarity=similarity
-                    )
-                    edge_count += 1
+                self.edges.append(edge)
+                edge_count += 1
         
         print(f"✅ Created {edge_count} semantic edges")
     
@@ -263,36 +438,57 @@ class FlowMetricsGraphBuilder:
         """Save the graph in multiple formats"""
         print("💾 Saving graph data...")
         
-        # Save nodes
+        # Materialize the NetworkX graph once, in a single bulk call
+        nx_graph = self.build_nx_graph()
+        
+        # The four outputs are independent, so serialize and write them concurrently
+        tasks = [
+            (self._save_nodes, "graphs/nodes/flowmetrics_nodes.json"),
+            (self._save_edges, "graphs/edges/flowmetrics_edges.json"),
+            (lambda path: nx.write_edgelist(nx_graph, path), "graphs/processed/flowmetrics_graph.edgelist"),
+            (self._save_summary, "graphs/processed/graph_summary.json")
+        ]
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(task, path) for task, path in tasks]
+            for future in futures:
+                future.result()
+        
+        print("✅ Graph saved successfully!")
+        print(f"   📊 Nodes: {len(self.nodes)}")
+        print(f"   🔗 Edges: {len(self.edges)}")
+        print(f"   📁 Files: graphs/nodes/, graphs/edges/, graphs/processed/")
+    
+    def _save_nodes(self, path: str) -> None:
+        """Serialize nodes (including embeddings) and write them to disk"""
         nodes_data = {
             "metadata": {
                 "total_nodes": len(self.nodes),
                 "node_types": list(set(node.type for node in self.nodes.values())),
                 "creation_timestamp": datetime.now().isoformat()
             },
-            "nodes": [asdict(node) for node in self.nodes.values()]
+            "nodes": [_shallow_dict(node, _NODE_FIELDS) for node in self.nodes.values()]
         }
         
-        with open("graphs/nodes/flowmetrics_nodes.json", "w") as f:
-            json.dump(nodes_data, f, indent=2)
-        
-        # Save edges
+        with open(path, "w") as f:
+            # Embedding rows become lists only here, at serialization time
+            json.dump(nodes_data, f, indent=2, default=_json_default)
+    
+    def _save_edges(self, path: str) -> None:
+        """Serialize edges and write them to disk"""
         edges_data = {
             "metadata": {
                 "total_edges": len(self.edges),
                 "relationship_types": list(set(edge.relationship_type for edge in self.edges)),
                 "creation_timestamp": datetime.now().isoformat()
             },
-            "edges": [asdict(edge) for edge in self.edges]
+            "edges": [_shallow_dict(edge, _EDGE_FIELDS) for edge in self.edges]
         }
         
-        with open("graphs/edges/flowmetrics_edges.json", "w") as f:
+        with open(path, "w") as f:
             json.dump(edges_data, f, indent=2)
-        
-        # Save as simple edge list instead of GEXF
-        nx.write_edgelist(self.nx_graph, "graphs/processed/flowmetrics_graph.edgelist")
-        
-        # Create summary
+    
+    def _save_summary(self, path: str) -> None:
+        """Compute the graph summary and write it to disk"""
         summary = {
             "graph_summary": {
                 "total_nodes": len(self.nodes),
@@ -320,10 +516,5 @@ class FlowMetricsGraphBuilder:
             relevant_nodes = [n for n in self.nodes.values() if n.audience_relevance.get(audience, 0) > 0.3]
             summary["graph_summary"]["audience_coverage"][audience] = len(relevant_nodes)
         
-        with open("graphs/processed/graph_summary.json", "w") as f:
+        with open(path, "w") as f:
             json.dump(summary, f, indent=2)
-        
-        print("✅ Graph saved successfully!")
-        print(f"   📊 Nodes: {len(self.nodes)}")
-        print(f"   🔗 Edges: {len(self.edges)}")
-        print(f"   📁 Files: graphs/nodes/, graphs/edges/, graphs/processed/") 
\ No newline at end of file
@@ -9,6 +9,7 @@ import pandas as pd
 import json
 from enhanced_visualizer import EnhancedGraphVisualizer
 import plotly.graph_objects as go
+import networkx as nx
 from collections import defaultdict
 import numpy as np
 
@@ -27,6 +28,29 @@ def load_visualizer():
         "graphs/edges/flowmetrics_edges.json"
     )
 
+@st.cache_resource
+def load_layout():
+    """Spring layout of the full graph, computed once and reused by every filter combination"""
+    visualizer = load_visualizer()
+    return nx.spring_layout(visualizer.graph, k=3, iterations=100, seed=42)
+
+@st.cache_resource
+def render_network(selected_audience, importance_levels, node_types, min_relevance, edge_strength,
+                   _filtered_graph):
+    """Build the network figure for a filter state (cached per filter tuple)
+    
+    `_filtered_graph` is main()'s apply_filters result for that state; the leading underscore keeps
+    Streamlit from hashing it.
+    """
+    visualizer = load_visualizer()
+    
+    title = f"Knowledge Graph - {selected_audience}" if selected_audience != "All Audiences" else "Complete Knowledge Graph"
+    return visualizer.create_interactive_network(
+        _filtered_graph, title,
+        selected_audience if selected_audience != "All Audiences" else None,
+        pos=load_layout()
+    )
+
 def main():
     st.title("🧠 FlowMetrics Knowledge Graph Explorer")
     st.markdown("**Navigate your data insights with intelligent filtering and audience-specific views**")
@@ -111,10 +135,9 @@ def main():
                 st.metric("High Priority", high_importance)
             
             # Generate and display graph
-            title = f"Knowledge Graph - {selected_audience}" if selected_audience != "All Audiences" else "Complete Knowledge Graph"
-            fig = visualizer.create_interactive_network(
-                filtered_graph, title, 
-                selected_audience if selected_audience != "All Audiences" else None
+            fig = render_network(
+                selected_audience, tuple(importance_levels), tuple(node_types),
+                min_relevance, tuple(edge_strength), filtered_graph
             )
             
             st.plotly_chart(fig, use_container_width=True, height=700)
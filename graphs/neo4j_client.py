@@ -3,20 +3,113 @@ Neo4j Graph Database Client for Agentic Commerce Graph Visualization
 Provides powerful graph database operations similar to Linkurious platform
 """
 
+import os
 import json
+import gzip
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import re
+import asyncio
+import threading
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 from datetime import datetime
 import uuid
+from collections import defaultdict
+from itertools import islice
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-from neo4j import GraphDatabase
+try:
+    import orjson
+    AUD_LOADS = orjson.loads
+    AUD_DUMPS = lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+    AUD_LOADS = json.loads
+    AUD_DUMPS = json.dumps
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+from neo4j import GraphDatabase, AsyncGraphDatabase, RoutingControl, Driver, WRITE_ACCESS
 from neo4j.exceptions import ServiceUnavailable, AuthError
 import pandas as pd
 import numpy as np
+import networkx as nx
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# all-MiniLM-L6-v2 embedding size
+EMBEDDING_DIMENSIONS = 384
+
+# Rows sent per UNWIND transaction during bulk ingestion
+BATCH_SIZE = 1000
+
+# Edge rows are a few scalars (no embeddings), so they amortise far larger transactions
+EDGE_BATCH_SIZE = 20000
+
+# Maximum number of concurrent async sessions used for ingestion
+INGEST_CONCURRENCY = 8
+
+# Connections opened up front by warm_pool() so first queries skip the Bolt handshake
+POOL_WARM_CONNECTIONS = 5
+
+# Records pulled per fetch() when streaming query results
+RESULT_FETCH_CHUNK = 1000
+
+# Records per Bolt PULL for queries that can return large result sets (driver default is 1000)
+LARGE_RESULT_FETCH_SIZE = 10000
+
+# Half-width of the precomputed layout, in the UI's pixel coordinates
+LAYOUT_SCALE = 1000
+
+# Rows buffered from a streamed JSON file before each load (enough to fill every ingest lane)
+STREAM_FLUSH_ROWS = BATCH_SIZE * INGEST_CONCURRENCY
+EDGE_STREAM_FLUSH_ROWS = EDGE_BATCH_SIZE * INGEST_CONCURRENCY
+
+# Rows shipped per apoc.periodic.iterate call, to bound server heap
+APOC_CHUNK_SIZE = 50000
+
+# Name of the in-memory GDS projection used for centrality
+GDS_GRAPH_NAME = 'agentic'
+
+UNIQUE_NODE_ID_CONSTRAINT = "CREATE CONSTRAINT unique_node_id IF NOT EXISTS FOR (n:Node) REQUIRE n.id IS UNIQUE"
+
+# Neighbor traversal depth is capped so every variant can be precompiled (stable query text -> plan cache hits)
+MAX_NEIGHBOR_DEPTH = 3
+
+# Characters with special meaning in Lucene query syntax (used by the node_text full-text index)
+LUCENE_SPECIAL_CHARS = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+# Boolean operators in Lucene query syntax (only recognised in upper case)
+LUCENE_OPERATORS = re.compile(r'\b(AND|OR|NOT)\b')
+
+NEIGHBOR_QUERY_TEMPLATE = """
+MATCH path = (center:Node {{id: $node_id}})-[r:RELATES_TO*1..{depth}]-(neighbor:Node)
+WHERE all(rel in relationships(path) WHERE rel.weight >= $min_weight)
+WITH center, neighbor, relationships(path) as rels
+RETURN center.id as center_id, center.content as center_content, center.type as center_type,
+       collect(DISTINCT {{
+           id: neighbor.id,
+           content: neighbor.content,
+           type: neighbor.type,
+           source: neighbor.source,
+           confidence: neighbor.confidence,
+           relationship_weight: [rel in rels | rel.weight][0]
+       }}) as neighbors
+"""
+
+NEIGHBOR_QUERIES = {
+    depth: NEIGHBOR_QUERY_TEMPLATE.format(depth=depth)
+    for depth in range(1, MAX_NEIGHBOR_DEPTH + 1)
+}
+
 class Neo4jGraphClient:
     """
     Professional Neo4j client for graph visualization platform
@@ -25,249 +118,711 @@ class Neo4jGraphClient:
     
     def __init__(self, uri: str = "neo4j://127.0.0.1:7687", 
                  username: str = "neo4j", 
-                 password: str = "password"):
-        """Initialize Neo4j connection"""
+                 password: str = "password",
+                 database: str = "neo4j",
+                 driver: Optional[Driver] = None):
+        """Initialize Neo4j connection (or wrap an already-open `driver`)"""
+        self._uri = uri
+        self._auth = (username, password)
+        self.database = database
+        # uri/auth only describe our own driver; an injected one may point elsewhere
+        self._driver_injected = driver is not None
+        # Async driver and the event loop it is bound to, created on first async use
+        self._async_driver = None
+        self._loop = None
         try:
-            self.driver = GraphDatabase.driver(uri, auth=(username, password))
+            self.driver = driver or GraphDatabase.driver(
+                uri, auth=self._auth,
+                max_connection_pool_size=50,
+                connection_acquisition_timeout=30
+            )
             self.verify_connectivity()
+            # Optional server plugins: APOC for bulk loading, GDS for centrality
+            self.has_apoc = self._has_procedure('apoc.periodic.iterate')
+            self.has_gds = self._has_procedure('gds.degree.stream')
             logger.info("✅ Successfully connected to Neo4j database")
         except (ServiceUnavailable, AuthError) as e:
             logger.error(f"❌ Failed to connect to Neo4j: {e}")
             raise
     
+    def _write_session(self):
+        """Session on the configured database for writes and schema operations"""
+        return self.driver.session(database=self.database, default_access_mode=WRITE_ACCESS)
+    
     def verify_connectivity(self):
         """Verify database connection"""
-        with self.driver.session() as session:
-            result = session.run("CALL db.ping()")
-            result.consume()
+        self.driver.verify_connectivity()
+    
+    def warm_pool(self, connections: int = POOL_WARM_CONNECTIONS):
+        """Open `connections` pooled connections concurrently on the pool ingestion will use (best-effort)"""
+        try:
+            if self._can_run_async():
+                # Batches and schema writes go through the async driver in this context
+                self._run_async(self._warm_async_pool(connections))
+            else:
+                self._warm_sync_pool(connections)
+            logger.info(f"🔥 Warmed {connections} pooled connections")
+        except Exception as e:
+            logger.warning(f"⚠️ Connection pool warm-up failed, continuing without it: {e}")
+    
+    def _warm_sync_pool(self, connections: int):
+        # Every session stays open until all have connected, forcing distinct connections
+        barrier = threading.Barrier(connections)
+        
+        def open_connection(_):
+            try:
+                with self.driver.session(database=self.database) as session:
+                    session.run("RETURN 1").consume()
+                    barrier.wait(timeout=30)
+            except Exception:
+                # Release the other sessions instead of leaving them waiting out the timeout
+                barrier.abort()
+                raise
+        
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            list(executor.map(open_connection, range(connections)))
+    
+    async def _warm_async_pool(self, connections: int):
+        driver = self._get_async_driver()
+        barrier = asyncio.Barrier(connections)
+        
+        async def open_connection():
+            try:
+                async with driver.session(database=self.database) as session:
+                    result = await session.run("RETURN 1")
+                    await result.consume()
+                    await asyncio.wait_for(barrier.wait(), timeout=30)
+            except Exception:
+                await barrier.abort()
+                raise
+        
+        await asyncio.gather(*(open_connection() for _ in range(connections)))
+    
+    def _has_procedure(self, name: str) -> bool:
+        """Check whether a server-side procedure (e.g. from APOC or GDS) is installed"""
+        try:
+            with self._write_session() as session:
+                record = session.run("""
+                    SHOW PROCEDURES YIELD name
+                    WHERE name = $name
+                    RETURN count(*) AS count
+                """, name=name).single()
+            return bool(record and record['count'])
+        except Exception as e:
+            logger.info(f"{name} not available, using the Cypher fallback: {e}")
+            return False
+    
+    def _ensure_gds_projection(self):
+        """Project the Node/RELATES_TO graph into GDS memory once (reused until the data changes)"""
+        with self._write_session() as session:
+            exists = session.run("CALL gds.graph.exists($name) YIELD exists RETURN exists",
+                                 name=GDS_GRAPH_NAME).single()['exists']
+            if not exists:
+                # Undirected so degree counts both directions, like (n)-[r]-()
+                session.run("""
+                    CALL gds.graph.project($name, 'Node', {RELATES_TO: {orientation: 'UNDIRECTED'}})
+                """, name=GDS_GRAPH_NAME).consume()
+    
+    def _drop_gds_projection(self):
+        """Drop the GDS projection so the next analytics call re-projects fresh data"""
+        if not self.has_gds:
+            return
+        with self._write_session() as session:
+            session.run("CALL gds.graph.drop($name, false) YIELD graphName RETURN graphName",
+                        name=GDS_GRAPH_NAME).consume()
     
     def close(self):
         """Close database connection"""
+        if self._async_driver is not None:
+            self._loop.run_until_complete(self._async_driver.close())
+            self._async_driver = None
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
         if self.driver:
             self.driver.close()
             logger.info("Neo4j connection closed")
     
+    def _can_run_async(self) -> bool:
+        """Async paths need a driver we configured ourselves and no event loop already running"""
+        if self._driver_injected:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        return False
+    
+    def _run_async(self, coro):
+        """Run a coroutine on the client's own event loop, where its async driver lives"""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+    
+    def _get_async_driver(self):
+        """Async driver shared by every async ingest and schema call of this client"""
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
+                self._uri, auth=self._auth,
+                max_connection_pool_size=50,
+                connection_acquisition_timeout=30
+            )
+        return self._async_driver
+    
     def clear_database(self):
         """Clear all nodes and relationships - use with caution!"""
-        with self.driver.session() as session:
+        with self._write_session() as session:
             session.run("MATCH (n) DETACH DELETE n")
+        self._drop_gds_projection()
         logger.info("🗑️ Database cleared")
     
+    def get_import_fingerprint(self) -> Optional[Dict]:
+        """Hashes of the node/edge files from the last successful import (None if never recorded)"""
+        return self._query_single("""
+            MATCH (m:Meta {id: 'import'})
+            RETURN m.nodes_sha AS nodes_sha, m.edges_sha AS edges_sha
+        """)
+    
+    def record_import_fingerprint(self, nodes_sha: str, edges_sha: str):
+        """Remember which node/edge files the graph was built from"""
+        with self._write_session() as session:
+            session.run("""
+                MERGE (m:Meta {id: 'import'})
+                SET m.nodes_sha = $nodes_sha, m.edges_sha = $edges_sha, m.ts = timestamp()
+            """, nodes_sha=nodes_sha, edges_sha=edges_sha).consume()
+    
     def create_constraints(self):
         """Create database constraints for optimal performance"""
         constraints = [
-            "CREATE CONSTRAINT unique_node_id IF NOT EXISTS FOR (n:Node) REQUIRE n.id IS UNIQUE",
+            UNIQUE_NODE_ID_CONSTRAINT,
             "CREATE CONSTRAINT unique_metric_id IF NOT EXISTS FOR (m:Metric) REQUIRE m.id IS UNIQUE", 
             "CREATE CONSTRAINT unique_insight_id IF NOT EXISTS FOR (i:Insight) REQUIRE i.id IS UNIQUE",
             "CREATE INDEX node_type_index IF NOT EXISTS FOR (n:Node) ON (n.type)",
             "CREATE INDEX node_source_index IF NOT EXISTS FOR (n:Node) ON (n.source)",
             "CREATE INDEX node_tags_index IF NOT EXISTS FOR (n:Node) ON (n.tags)",
-            "CREATE INDEX relationship_weight_index IF NOT EXISTS FOR ()-[r:RELATES_TO]-() ON (r.weight)"
+            # Range indexes back both the >= filters and ORDER BY ... DESC top-K scans
+            "CREATE RANGE INDEX relationship_weight_index IF NOT EXISTS FOR ()-[r:RELATES_TO]-() ON (r.weight)",
+            "CREATE RANGE INDEX node_confidence IF NOT EXISTS FOR (n:Node) ON (n.confidence)",
+            "CREATE FULLTEXT INDEX node_text IF NOT EXISTS FOR (n:Node) ON EACH [n.content, n.source]",
+            f"""CREATE VECTOR INDEX node_embedding IF NOT EXISTS FOR (n:Node) ON n.embedding
+                OPTIONS {{indexConfig: {{`vector.dimensions`: {EMBEDDING_DIMENSIONS}, `vector.similarity_function`: 'cosine'}}}}"""
         ]
         
-        with self.driver.session() as session:
-            for constraint in constraints:
-                try:
-                    session.run(constraint)
-                except Exception as e:
-                    logger.warning(f"Constraint/Index already exists or failed: {e}")
+        if self._can_run_async():
+            # Schema ops are independent, so submit them all at once
+            self._run_async(self._create_schema_async(constraints))
+        else:
+            with self._write_session() as session:
+                for constraint in constraints:
+                    try:
+                        session.run(constraint).consume()
+                    except Exception as e:
+                        logger.warning(f"Constraint/Index already exists or failed: {e}")
         
         logger.info("🔧 Database constraints and indexes created")
     
+    async def _create_schema_async(self, statements: List[str]) -> None:
+        """Run independent schema statements concurrently, one async session each"""
+        driver = self._get_async_driver()
+        
+        async def run_statement(statement: str) -> None:
+            try:
+                async with driver.session(database=self.database) as session:
+                    result = await session.run(statement)
+                    await result.consume()
+            except Exception as e:
+                logger.warning(f"Constraint/Index already exists or failed: {e}")
+        
+        await asyncio.gather(*(run_statement(statement) for statement in statements))
+    
+    @staticmethod
+    def _chunk(rows: List[Dict], size: int = BATCH_SIZE) -> List[List[Dict]]:
+        """Split rows into `size`-row slices"""
+        rows_iter = iter(rows)
+        batches = []
+        while True:
+            batch = list(islice(rows_iter, size))
+            if not batch:
+                return batches
+            batches.append(batch)
+    
+    def _write_batch(self, session, query: str, batch: List[Dict], retries: int = 3) -> int:
+        """Run an UNWIND write query for one batch in its own transaction, with retries"""
+        for attempt in range(1, retries + 1):
+            try:
+                session.execute_write(lambda tx: tx.run(query, rows=batch).consume())
+                return len(batch)
+            except Exception as e:
+                if attempt == retries:
+                    logger.error(f"Failed to load batch of {len(batch)} rows after {retries} attempts: {e}")
+                else:
+                    logger.warning(f"Batch write failed (attempt {attempt}/{retries}), retrying: {e}")
+        return 0
+    
+    @staticmethod
+    async def _run_batch_async(tx, query: str, batch: List[Dict]) -> None:
+        result = await tx.run(query, rows=batch)
+        await result.consume()
+    
+    async def _write_lanes_async(self, query: str, lanes: List[List[List[Dict]]], retries: int = 3) -> int:
+        """Write lanes of batches concurrently; batches within one lane run in order"""
+        semaphore = asyncio.Semaphore(INGEST_CONCURRENCY)
+        driver = self._get_async_driver()
+        
+        async def write_lane(lane: List[List[Dict]]) -> int:
+            loaded = 0
+            async with semaphore:
+                async with driver.session(database=self.database) as session:
+                    for batch in lane:
+                        for attempt in range(1, retries + 1):
+                            try:
+                                await session.execute_write(self._run_batch_async, query, batch)
+                                loaded += len(batch)
+                                break
+                            except Exception as e:
+                                if attempt == retries:
+                                    logger.error(f"Failed to load batch of {len(batch)} rows after {retries} attempts: {e}")
+                                else:
+                                    logger.warning(f"Batch write failed (attempt {attempt}/{retries}), retrying: {e}")
+            return loaded
+        
+        counts = await asyncio.gather(*(write_lane(lane) for lane in lanes))
+        
+        return sum(counts)
+    
+    def _iterate_apoc(self, row_query: str, rows: List[Dict], batch_size: int = BATCH_SIZE) -> int:
+        """Bulk write via apoc.periodic.iterate (server-side batching, parallelism and retries)"""
+        loaded_count = 0
+        with self._write_session() as session:
+            # Stream the rows in APOC_CHUNK_SIZE pieces to bound server heap
+            for chunk in self._chunk(rows, APOC_CHUNK_SIZE):
+                record = session.run("""
+                    CALL apoc.periodic.iterate(
+                        'WITH datetime() AS now UNWIND $rows AS row RETURN row, now',
+                        $row_query,
+                        {batchSize: $batch_size, parallel: true, retries: 3,
+                         concurrency: $concurrency, params: {rows: $rows}}
+                    )
+                    YIELD total, failedOperations, errorMessages
+                    RETURN total, failedOperations, errorMessages
+                """, row_query=row_query, rows=chunk,
+                     batch_size=batch_size, concurrency=INGEST_CONCURRENCY).single()
+                
+                loaded_count += record['total'] - record['failedOperations']
+                if record['failedOperations']:
+                    logger.error(f"apoc.periodic.iterate failed {record['failedOperations']} rows: {record['errorMessages']}")
+        
+        return loaded_count
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _node_merge_query(label: str) -> str:
+        """Cypher for upserting nodes of one label (cached so the query text stays stable per label)"""
+        # MERGE on the unique id makes replaying a half-written batch after a resume harmless
+        return (f"MERGE (n:Node {{id: row.id}}) ON CREATE SET n.created_at = now "
+                f"SET n:{label}, n += row")
+    
+    def _load_rows(self, row_query: str, rows: List[Dict], partition_key: str = None,
+                   batch_size: int = BATCH_SIZE) -> int:
+        """Write rows with `row_query` (which reads `row` and `now`), via APOC when available, else UNWIND batches
+        
+        With `partition_key`, rows sharing a key value stay in the same sequential lane.
+        """
+        if self.has_apoc:
+            return self._iterate_apoc(row_query, rows, batch_size)
+        
+        # datetime() is evaluated once per batch and exposed to row_query as `now`
+        query = f"WITH datetime() AS now\nUNWIND $rows AS row\n{row_query}"
+        if partition_key is None:
+            # Every batch is its own lane
+            return self._ingest(query, [[batch] for batch in self._chunk(rows, batch_size)])
+        
+        bins: List[List[Dict]] = [[] for _ in range(INGEST_CONCURRENCY)]
+        for row in rows:
+            bins[hash(row[partition_key]) % INGEST_CONCURRENCY].append(row)
+        return self._ingest(query, [self._chunk(rows_bin, batch_size) for rows_bin in bins if rows_bin])
+    
+    def _write_lane(self, query: str, lane: List[List[Dict]]) -> int:
+        """Write one lane's batches in order on its own session (the sync driver is thread-safe)"""
+        with self._write_session() as session:
+            return sum(self._write_batch(session, query, batch) for batch in lane)
+    
+    def _ingest(self, query: str, lanes: List[List[List[Dict]]]) -> int:
+        """Write batches concurrently over async sessions, or over a thread pool on the sync driver"""
+        if self._can_run_async():
+            return self._run_async(self._write_lanes_async(query, lanes))
+        
+        # e.g. called from the FastAPI startup hook (a loop is already running), or with an injected driver
+        with ThreadPoolExecutor(max_workers=INGEST_CONCURRENCY) as executor:
+            return sum(executor.map(lambda lane: self._write_lane(query, lane), lanes))
+    
+    @staticmethod
+    def _iter_json_items(path: str, key: str) -> Iterator[Dict]:
+        """Yield the items of the top-level `key` array, streamed with ijson when it is installed
+        
+        `.jsonl` files (one object per line) are read line by line, which is cheaper than ijson.
+        A trailing `.gz` is decompressed on the fly. `.parquet` files (one row per item, see
+        setup_graph_platform.convert_to_parquet) are read column-wise in record batches, with
+        the JSON-encoded columns named in the schema metadata decoded back to their values.
+        """
+        if path.endswith('.parquet'):
+            if pq is None:
+                raise ImportError("pyarrow is required to read .parquet graph data")
+            parquet_file = pq.ParquetFile(path)
+            schema_metadata = parquet_file.schema_arrow.metadata or {}
+            json_columns = [c for c in schema_metadata.get(b'json_columns', b'').decode().split(',') if c]
+            for batch in parquet_file.iter_batches(batch_size=BATCH_SIZE):
+                for item in batch.to_pylist():
+                    for column in json_columns:
+                        if item[column] is not None:
+                            item[column] = AUD_LOADS(item[column])
+                    yield item
+            return
+        
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as f:
+            if path.removesuffix('.gz').endswith('.jsonl'):
+                yield from (AUD_LOADS(line) for line in f if line.strip())
+            elif ijson is not None:
+                # use_float: plain floats instead of Decimal, so values go straight to Bolt
+                yield from ijson.items(f, f'{key}.item', use_float=True)
+            else:
+                yield from AUD_LOADS(f.read()).get(key, [])
+    
+    @staticmethod
+    def _file_signature(path: str) -> str:
+        """Cheap identity of a file's contents (size + mtime) to validate a checkpoint against"""
+        stat = os.stat(path)
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+    
+    def _get_checkpoint(self, path: str) -> int:
+        """Items of `path` already committed by an interrupted import (0 if none or the file changed)"""
+        record = self._query_single("""
+            MATCH (c:ImportCheckpoint {file: $file})
+            RETURN c.offset AS offset, c.signature AS signature
+        """, {'file': path})
+        if record and record['signature'] == self._file_signature(path):
+            return record['offset']
+        return 0
+    
+    def _set_checkpoint(self, path: str, offset: Optional[int]):
+        """Record how many items of `path` are committed; None removes the checkpoint once the file is done"""
+        with self._write_session() as session:
+            if offset is None:
+                session.run("MATCH (c:ImportCheckpoint {file: $file}) DELETE c", file=path).consume()
+            else:
+                session.run("""
+                    MERGE (c:ImportCheckpoint {file: $file})
+                    SET c.offset = $offset, c.signature = $signature
+                """, file=path, offset=offset, signature=self._file_signature(path)).consume()
+    
+    def _resume_items(self, path: str, key: str) -> Tuple[int, Iterator[Dict]]:
+        """Start offset and item iterator for `path`, skipping what a previous run already committed"""
+        offset = self._get_checkpoint(path)
+        if offset:
+            logger.info(f"⏩ Resuming {path} from item {offset}")
+        return offset, islice(self._iter_json_items(path, key), offset, None)
+    
+    @staticmethod
+    def _check_flushed(loaded: int, expected: int, path: str):
+        """Refuse to move a checkpoint past rows that failed to write (failed batches return 0)"""
+        if loaded != expected:
+            raise RuntimeError(f"Only {loaded} of {expected} rows from {path} were written; "
+                               f"rerun to resume from the last checkpoint")
+    
     def load_nodes_from_json(self, nodes_file: str) -> int:
         """Load nodes from JSON file into Neo4j"""
         logger.info(f"📥 Loading nodes from {nodes_file}")
         
-        with open(nodes_file, 'r') as f:
-            data = json.load(f)
+        def flush() -> int:
+            # Every buffered label is written before the checkpoint advances past its rows
+            expected = sum(len(rows) for rows in groups.values())
+            count = sum(self._load_rows(self._node_merge_query(label), rows) for label, rows in groups.items())
+            groups.clear()
+            self._check_flushed(count, expected, nodes_file)
+            self._set_checkpoint(nodes_file, offset)
+            return count
         
-        nodes = data.get('nodes', [])
+        # Group rows by label, since the label has to be interpolated into the Cypher
+        groups: Dict[str, List[Dict]] = defaultdict(list)
+        buffered = 0
         loaded_count = 0
+        offset, nodes = self._resume_items(nodes_file, 'nodes')
+        for node in nodes:
+            node_type = node.get('type', 'Node').capitalize()
+            audience_relevance = node.get('audience_relevance', {})
+            row = {
+                'id': node.get('id'),
+                'type': node.get('type'),
+                'content': node.get('content'),
+                'value': node.get('value'),
+                'timestamp': node.get('timestamp'),
+                'confidence': node.get('confidence'),
+                'source': node.get('source'),
+                'tags': node.get('tags', []),
+                'audience_relevance_json': AUD_DUMPS(audience_relevance),
+                # Native LIST<FLOAT> (packed by Bolt) so it can back the vector index
+                'embedding': node.get('embedding') or None
+            }
+            # Flattened per-audience scores, queryable without parsing JSON
+            for audience, score in audience_relevance.items():
+                row[f'audience_{audience}'] = score
+            groups[node_type].append(row)
+            offset += 1
+            buffered += 1
+            
+            # Dispatch full buffers while the rest of the file is still being parsed
+            if buffered >= STREAM_FLUSH_ROWS:
+                loaded_count += flush()
+                buffered = 0
         
-        with self.driver.session() as session:
-            for node in nodes:
-                # Create node with appropriate label based on type
-                node_type = node.get('type', 'Node').capitalize()
-                
-                query = f"""
-                CREATE (n:{node_type}:Node {{
-                    id: $id,
-                    type: $type,
-                    content: $content,
-                    value: $value,
-                    timestamp: $timestamp,
-                    confidence: $confidence,
-                    source: $source,
-                    tags: $tags,
-                    audience_relevance_json: $audience_relevance_json,
-                    embedding_json: $embedding_json,
-                    created_at: datetime()
-                }})
-                """
-                
-                try:
-                    session.run(query, {
-                        'id': node.get('id'),
-                        'type': node.get('type'),
-                        'content': node.get('content'),
-                        'value': node.get('value'),
-                        'timestamp': node.get('timestamp'),
-                        'confidence': node.get('confidence'),
-                        'source': node.get('source'),
-                        'tags': node.get('tags', []),
-                        'audience_relevance_json': json.dumps(node.get('audience_relevance', {})),
-                        'embedding_json': json.dumps(node.get('embedding', []))
-                    })
-                    loaded_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to load node {node.get('id')}: {e}")
+        loaded_count += flush()
+        self._set_checkpoint(nodes_file, None)
         
         logger.info(f"✅ Loaded {loaded_count} nodes successfully")
         return loaded_count
     
+    def backfill_audience_scores(self) -> int:
+        """Write the flattened audience_<name> scores on nodes that only carry audience_relevance_json
+        
+        Graphs loaded before the scores were flattened have no such properties, and the audience
+        queries read nothing else.
+        """
+        records = self._query("""
+            MATCH (n:Node)
+            WHERE n.audience_relevance_json IS NOT NULL
+              AND none(key IN keys(n) WHERE key STARTS WITH 'audience_' AND key <> 'audience_relevance_json')
+            RETURN n.id AS id, n.audience_relevance_json AS audience_relevance_json
+        """, fetch_size=LARGE_RESULT_FETCH_SIZE)
+        
+        rows = []
+        for record in records:
+            scores = {f'audience_{audience}': score
+                      for audience, score in AUD_LOADS(record['audience_relevance_json']).items()}
+            if scores:
+                rows.append({'id': record['id'], 'scores': scores})
+        if not rows:
+            return 0
+        
+        loaded = self._load_rows("MATCH (n:Node {id: row.id}) SET n += row.scores", rows,
+                                 batch_size=EDGE_BATCH_SIZE)
+        logger.info(f"🔧 Backfilled audience scores on {loaded} nodes")
+        return loaded
+    
     def load_edges_from_json(self, edges_file: str) -> int:
         """Load edges from JSON file into Neo4j"""
         logger.info(f"📥 Loading edges from {edges_file}")
         
-        with open(edges_file, 'r') as f:
-            data = json.load(f)
+        row_query = """
+        MATCH (source:Node {id: row.src})
+        MATCH (target:Node {id: row.tgt})
+        MERGE (source)-[r:RELATES_TO {relationship_type: row.props.relationship_type}]->(target)
+        ON CREATE SET r.created_at = now
+        SET r += row.props
+        """
+        
+        with self._write_session() as session:
+            # The MATCHes need the Node.id uniqueness index to be seeks rather than scans
+            session.run(UNIQUE_NODE_ID_CONSTRAINT).consume()
         
-        edges = data.get('edges', [])
         loaded_count = 0
+        rows = []
+        offset, edges = self._resume_items(edges_file, 'edges')
+        for edge in edges:
+            rows.append({
+                'src': edge.get('source_id'),
+                'tgt': edge.get('target_id'),
+                'props': {
+                    'relationship_type': edge.get('relationship_type'),
+                    'weight': edge.get('weight'),
+                    'confidence': edge.get('confidence'),
+                    'semantic_similarity': edge.get('semantic_similarity'),
+                    'metadata_json': AUD_DUMPS(edge.get('metadata', {}))
+                }
+            })
+            offset += 1
+            if len(rows) >= EDGE_STREAM_FLUSH_ROWS:
+                # Bin edges by source node so concurrent writers don't lock the same nodes
+                count = self._load_rows(row_query, rows, partition_key='src', batch_size=EDGE_BATCH_SIZE)
+                self._check_flushed(count, len(rows), edges_file)
+                loaded_count += count
+                self._set_checkpoint(edges_file, offset)
+                rows = []
         
-        with self.driver.session() as session:
-            for edge in edges:
-                query = """
-                MATCH (source {id: $source_id})
-                MATCH (target {id: $target_id})
-                CREATE (source)-[r:RELATES_TO {
-                    relationship_type: $relationship_type,
-                    weight: $weight,
-                    confidence: $confidence,
-                    semantic_similarity: $semantic_similarity,
-                    metadata_json: $metadata_json,
-                    created_at: datetime()
-                }]->(target)
-                """
-                
-                try:
-                    session.run(query, {
-                        'source_id': edge.get('source_id'),
-                        'target_id': edge.get('target_id'),
-                        'relationship_type': edge.get('relationship_type'),
-                        'weight': edge.get('weight'),
-                        'confidence': edge.get('confidence'),
-                        'semantic_similarity': edge.get('semantic_similarity'),
-                        'metadata_json': json.dumps(edge.get('metadata', {}))
-                    })
-                    loaded_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to load edge {edge.get('source_id')} -> {edge.get('target_id')}: {e}")
+        if rows:
+            count = self._load_rows(row_query, rows, partition_key='src', batch_size=EDGE_BATCH_SIZE)
+            self._check_flushed(count, len(rows), edges_file)
+            loaded_count += count
+        self._set_checkpoint(edges_file, None)
+        self._drop_gds_projection()
         
         logger.info(f"✅ Loaded {loaded_count} edges successfully")
         return loaded_count
     
+    @staticmethod
+    def _records_to_dicts(result) -> Iterator[Dict]:
+        """Stream a result as plain dicts, pulling records from the server in chunks"""
+        keys = result.keys()
+        while True:
+            records = result.fetch(RESULT_FETCH_CHUNK)
+            if not records:
+                return
+            for record in records:
+                yield dict(zip(keys, record))
+    
+    def _query(self, query: str, params: Dict = None, fetch_size: Optional[int] = None) -> List[Dict]:
+        """Run a read query through the driver's managed session pool and return plain dicts"""
+        if fetch_size:
+            # execute_query has no fetch_size knob, so large reads use a tuned session instead
+            with self.driver.session(database=self.database, fetch_size=fetch_size) as session:
+                return session.execute_read(lambda tx: list(self._records_to_dicts(tx.run(query, params or {}))))
+        
+        return self.driver.execute_query(
+            query, params or {},
+            routing_=RoutingControl.READ,
+            database_=self.database,
+            result_transformer_=lambda result: list(self._records_to_dicts(result))
+        )
+    
+    def _query_single(self, query: str, params: Dict = None) -> Optional[Dict]:
+        """Run a read query and return its first record (or None)"""
+        rows = self._query(query, params)
+        return rows[0] if rows else None
+    
+    def compute_layout(self) -> int:
+        """Precompute a spring layout once and store it as n.x / n.y, so browsers skip the physics simulation"""
+        record = self._query_single("""
+            CALL { MATCH (n:Node) RETURN collect(n.id) AS ids }
+            CALL {
+                MATCH (s:Node)-[r:RELATES_TO]->(t:Node)
+                RETURN collect([s.id, t.id, r.weight]) AS edges
+            }
+            RETURN ids, edges
+        """)
+        
+        graph = nx.Graph()
+        graph.add_nodes_from(record['ids'])
+        graph.add_weighted_edges_from(record['edges'])
+        pos = nx.spring_layout(graph, seed=42, iterations=100, scale=LAYOUT_SCALE)
+        
+        rows = [{'id': node_id, 'x': float(x), 'y': float(y)} for node_id, (x, y) in pos.items()]
+        loaded = self._load_rows("MATCH (n:Node {id: row.id}) SET n.x = row.x, n.y = row.y", rows,
+                                 batch_size=EDGE_BATCH_SIZE)
+        logger.info(f"📐 Stored layout coordinates for {loaded} nodes")
+        return loaded
+    
     def get_graph_overview(self) -> Dict[str, Any]:
         """Get comprehensive graph statistics"""
-        with self.driver.session() as session:
-            # Node counts by type
-            node_counts = session.run("""
+        # All six statistics in one round trip
+        stats = self._query_single("""
+            CALL {
+                // Total stats
+                MATCH (n:Node) RETURN count(n) as total_nodes
+            }
+            CALL {
+                MATCH ()-[r]->() RETURN count(r) as total_relationships
+            }
+            CALL {
+                // Node counts by type
                 MATCH (n:Node)
-                RETURN n.type as type, count(n) as count
+                WITH n.type as type, count(n) as count
                 ORDER BY count DESC
-            """).data()
-            
-            # Relationship counts
-            rel_counts = session.run("""
+                RETURN collect({type: type, count: count}) as node_types
+            }
+            CALL {
+                // Relationship counts
                 MATCH ()-[r]->()
-                RETURN type(r) as relationship_type, count(r) as count
+                WITH type(r) as relationship_type, count(r) as count
                 ORDER BY count DESC
-            """).data()
-            
-            # Top sources
-            top_sources = session.run("""
+                RETURN collect({relationship_type: relationship_type, count: count}) as relationship_types
+            }
+            CALL {
+                // Top sources
                 MATCH (n:Node)
                 WHERE n.source IS NOT NULL
-                RETURN n.source as source, count(n) as count
+                WITH n.source as source, count(n) as count
                 ORDER BY count DESC
                 LIMIT 10
-            """).data()
-            
-            # High confidence nodes
-            high_confidence = session.run("""
+                RETURN collect({source: source, count: count}) as top_sources
+            }
+            CALL {
+                // High confidence nodes
                 MATCH (n:Node)
                 WHERE n.confidence >= 0.8
                 RETURN count(n) as high_confidence_count
-            """).single()
-            
-            # Total stats
-            total_nodes = session.run("MATCH (n) RETURN count(n) as total").single()['total']
-            total_relationships = session.run("MATCH ()-[r]->() RETURN count(r) as total").single()['total']
-            
-            return {
-                'total_nodes': total_nodes,
-                'total_relationships': total_relationships,
-                'node_types': node_counts,
-                'relationship_types': rel_counts,
-                'top_sources': top_sources,
-                'high_confidence_nodes': high_confidence['high_confidence_count'] if high_confidence else 0,
-                'generated_at': datetime.now().isoformat()
             }
+            RETURN total_nodes, total_relationships, node_types, relationship_types,
+                   top_sources, high_confidence_count
+        """)
+        
+        return {
+            'total_nodes': stats['total_nodes'],
+            'total_relationships': stats['total_relationships'],
+            'node_types': stats['node_types'],
+            'relationship_types': stats['relationship_types'],
+            'top_sources': stats['top_sources'],
+            'high_confidence_nodes': stats['high_confidence_count'],
+            'generated_at': datetime.now().isoformat()
+        }
+    
+    def get_node_enums(self) -> Dict[str, List[str]]:
+        """Distinct node types and sources, in a stable order so list positions can serve as codes"""
+        record = self._query_single("""
+            MATCH (n:Node)
+            RETURN collect(DISTINCT n.type) AS types, collect(DISTINCT n.source) AS sources
+        """)
+        return {'types': sorted(record['types']), 'sources': sorted(record['sources'])}
     
     def search_nodes(self, query: str, limit: int = 50) -> List[Dict]:
         """Advanced node search with full-text capabilities"""
-        with self.driver.session() as session:
-            # Search in content, source, and tags
-            search_query = """
+        # An empty Lucene query is a parse error, not an empty match
+        if not query.strip():
+            return []
+        
+        # Content/source via the node_text full-text index, exact tags via a UNION branch
+        search_query = """
+        CALL {
+            CALL db.index.fulltext.queryNodes('node_text', $text_query) YIELD node, score
+            WHERE score > 0.1
+            RETURN node AS n, score
+            UNION
             MATCH (n:Node)
-            WHERE toLower(n.content) CONTAINS toLower($query)
-               OR toLower(n.source) CONTAINS toLower($query)
-               OR any(tag IN n.tags WHERE toLower(tag) CONTAINS toLower($query))
-            RETURN n.id as id, n.type as type, n.content as content, 
-                   n.source as source, n.tags as tags, n.confidence as confidence,
-                   n.value as value, n.timestamp as timestamp
-            ORDER BY n.confidence DESC
-            LIMIT $limit
-            """
-            
-            results = session.run(search_query, {'query': query, 'limit': limit})
-            return [dict(record) for record in results]
+            WHERE $query IN n.tags
+            RETURN n, 1.0 AS score
+        }
+        WITH n, max(score) AS score
+        RETURN n.id as id, n.type as type, n.content as content, 
+               n.source as source, n.tags as tags, n.confidence as confidence,
+               n.value as value, n.timestamp as timestamp
+        ORDER BY score DESC, n.confidence DESC
+        LIMIT $limit
+        """
+        
+        # Escape user input so it is matched literally rather than parsed as Lucene syntax
+        text_query = LUCENE_SPECIAL_CHARS.sub(r'\\\1', query)
+        # Lower-cased operators are plain terms (the index analyzer lower-cases text anyway)
+        text_query = LUCENE_OPERATORS.sub(lambda m: m.group(1).lower(), text_query)
+        
+        return self._query(search_query, {'query': query, 'text_query': text_query, 'limit': limit},
+                           fetch_size=LARGE_RESULT_FETCH_SIZE)
     
     def get_node_neighbors(self, node_id: str, depth: int = 1, min_weight: float = 0.3) -> Dict:
         """Get node and its neighbors with relationship details"""
-        with self.driver.session() as session:
-            query = f"""
-            MATCH path = (center:Node {{id: $node_id}})-[r:RELATES_TO*1..{depth}]-(neighbor:Node)
-            WHERE all(rel in relationships(path) WHERE rel.weight >= $min_weight)
-            WITH center, neighbor, relationships(path) as rels
-            RETURN center.id as center_id, center.content as center_content, center.type as center_type,
-                   collect(DISTINCT {{
-                       id: neighbor.id,
-                       content: neighbor.content,
-                       type: neighbor.type,
-                       source: neighbor.source,
-                       confidence: neighbor.confidence,
-                       relationship_weight: [rel in rels | rel.weight][0]
-                   }}) as neighbors
-            """
-            
-            result = session.run(query, {
-                'node_id': node_id, 
-                'min_weight': min_weight
-            }).single()
-            
-            if result:
-                return dict(result)
-            return {}
+        depth = min(max(int(depth), 1), MAX_NEIGHBOR_DEPTH)
+        
+        result = self._query_single(NEIGHBOR_QUERIES[depth], {
+            'node_id': node_id, 
+            'min_weight': min_weight
+        })
+        
+        if result:
+            return dict(result)
+        return {}
     
-    def get_filtered_graph(self, 
-                          node_types: List[str] = None,
-                          sources: List[str] = None,
-                          min_confidence: float = 0.0,
-                          min_weight: float = 0.3,
-                          tags: List[str] = None,
-                          limit: int = 100) -> Dict:
-        """Get filtered graph data for visualization"""
+    @staticmethod
+    def _filter_clause(node_types: List[str], sources: List[str], min_confidence: float,
+                       min_weight: float, tags: List[str], limit: int) -> Tuple[str, Dict]:
+        """WHERE clause and parameters shared by the filtered graph queries"""
         conditions = ["n.confidence >= $min_confidence"]
         params = {'min_confidence': min_confidence, 'min_weight': min_weight, 'limit': limit}
         
@@ -283,166 +838,233 @@ class Neo4jGraphClient:
             conditions.append("any(tag IN n.tags WHERE tag IN $tags)")
             params['tags'] = tags
         
-        where_clause = " AND ".join(conditions)
+        return " AND ".join(conditions), params
+    
+    def get_filtered_graph(self, 
+                          node_types: List[str] = None,
+                          sources: List[str] = None,
+                          min_confidence: float = 0.0,
+                          min_weight: float = 0.3,
+                          tags: List[str] = None,
+                          limit: int = 100) -> Dict:
+        """Get filtered graph data for visualization"""
+        where_clause, params = self._filter_clause(node_types, sources, min_confidence, min_weight, tags, limit)
         
-        with self.driver.session() as session:
-            # Get filtered nodes
-            nodes_query = f"""
-            MATCH (n:Node)
-            WHERE {where_clause}
-            RETURN n.id as id, n.type as type, n.content as content,
-                   n.source as source, n.confidence as confidence, n.value as value,
-                   n.tags as tags, n.audience_relevance_json as audience_relevance_json
-            ORDER BY n.confidence DESC
-            LIMIT $limit
-            """
-            
-            nodes = session.run(nodes_query, params).data()
-            node_ids = [node['id'] for node in nodes]
-            
-            # Get relationships between filtered nodes
-            if node_ids:
-                edges_query = """
-                MATCH (source:Node)-[r:RELATES_TO]->(target:Node)
-                WHERE source.id IN $node_ids AND target.id IN $node_ids
-                  AND r.weight >= $min_weight
-                RETURN source.id as source_id, target.id as target_id,
-                       r.weight as weight, r.confidence as confidence,
-                       r.semantic_similarity as semantic_similarity,
-                       r.relationship_type as relationship_type,
-                       r.metadata_json as metadata_json
-                ORDER BY r.weight DESC
-                """
-                
-                edges = session.run(edges_query, {
-                    'node_ids': node_ids,
-                    'min_weight': min_weight
-                }).data()
-            else:
-                edges = []
-            
-            return {
-                'nodes': nodes,
-                'edges': edges,
-                'filters_applied': {
-                    'node_types': node_types,
-                    'sources': sources,
-                    'min_confidence': min_confidence,
-                    'min_weight': min_weight,
-                    'tags': tags
-                },
-                'total_nodes': len(nodes),
-                'total_edges': len(edges)
-            }
+        # Nodes and the edges between them in one round trip; the node set never leaves the server
+        graph_query = f"""
+        MATCH (n:Node)
+        WHERE {where_clause}
+        WITH n
+        ORDER BY n.confidence DESC
+        LIMIT $limit
+        WITH collect(n) AS members
+        CALL {{
+            WITH members
+            UNWIND members AS source
+            MATCH (source)-[r:RELATES_TO]->(target:Node)
+            WHERE target IN members AND r.weight >= $min_weight
+            WITH source, target, r
+            ORDER BY r.weight DESC
+            RETURN collect({{
+                source_id: source.id, target_id: target.id,
+                weight: r.weight, confidence: r.confidence,
+                semantic_similarity: r.semantic_similarity,
+                relationship_type: r.relationship_type,
+                metadata_json: r.metadata_json
+            }}) AS edges
+        }}
+        RETURN [n IN members | {{
+                   id: n.id, type: n.type, content: n.content,
+                   source: n.source, confidence: n.confidence, value: n.value,
+                   tags: n.tags, audience_relevance_json: n.audience_relevance_json,
+                   x: n.x, y: n.y
+               }}] AS nodes,
+               edges
+        """
+        
+        record = self._query_single(graph_query, params)
+        nodes = record['nodes'] if record else []
+        edges = record['edges'] if record else []
+        
+        return {
+            'nodes': nodes,
+            'edges': edges,
+            'filters_applied': {
+                'node_types': node_types,
+                'sources': sources,
+                'min_confidence': min_confidence,
+                'min_weight': min_weight,
+                'tags': tags
+            },
+            'total_nodes': len(nodes),
+            'total_edges': len(edges)
+        }
+    
+    def iter_filtered_graph(self,
+                            node_types: List[str] = None,
+                            sources: List[str] = None,
+                            min_confidence: float = 0.0,
+                            min_weight: float = 0.3,
+                            tags: List[str] = None,
+                            limit: int = 100) -> Iterator[Tuple[str, Dict]]:
+        """Stream get_filtered_graph's nodes, then its edges, as ('node' | 'edge', item) pairs
+        
+        Rows are pulled from the result cursor in RESULT_FETCH_CHUNK pieces as the caller consumes them.
+        """
+        where_clause, params = self._filter_clause(node_types, sources, min_confidence, min_weight, tags, limit)
+        
+        # One row per node and per edge, instead of two collected lists in a single record
+        graph_query = f"""
+        MATCH (n:Node)
+        WHERE {where_clause}
+        WITH n
+        ORDER BY n.confidence DESC
+        LIMIT $limit
+        WITH collect(n) AS members
+        CALL {{
+            WITH members
+            UNWIND members AS n
+            RETURN 'node' AS kind, {{
+                id: n.id, type: n.type, content: n.content,
+                source: n.source, confidence: n.confidence, value: n.value,
+                tags: n.tags, audience_relevance_json: n.audience_relevance_json,
+                x: n.x, y: n.y
+            }} AS item
+            UNION ALL
+            WITH members
+            UNWIND members AS source
+            MATCH (source)-[r:RELATES_TO]->(target:Node)
+            WHERE target IN members AND r.weight >= $min_weight
+            WITH source, target, r
+            ORDER BY r.weight DESC
+            RETURN 'edge' AS kind, {{
+                source_id: source.id, target_id: target.id,
+                weight: r.weight, confidence: r.confidence,
+                semantic_similarity: r.semantic_similarity,
+                relationship_type: r.relationship_type,
+                metadata_json: r.metadata_json
+            }} AS item
+        }}
+        RETURN kind, item
+        """
+        
+        with self.driver.session(database=self.database, fetch_size=RESULT_FETCH_CHUNK) as session:
+            for record in session.run(graph_query, params):
+                yield record['kind'], record['item']
     
     def get_audience_focused_graph(self, audience: str, limit: int = 25) -> Dict:
         """Get a focused graph for specific audience with relevant insights and connections"""
-        with self.driver.session() as session:
-            try:
-                # Get all nodes with their audience relevance data
-                query = """
+        try:
+            # One round trip: focused top-K, expansion neighbours and the edges between them
+            query = """
+            CALL {
+                MATCH (m:Node)
+                WHERE coalesce(m[$audience_key], 0) > 0.1
+                RETURN count(m) AS relevant_total
+            }
+            CALL {
                 MATCH (n:Node)
-                WHERE n.audience_relevance_json IS NOT NULL
-                RETURN n.id as id, n.type as type, n.content as content,
-                       n.source as source, n.confidence as confidence, n.tags as tags,
-                       n.audience_relevance_json as audience_relevance_json, n.value as value
-                ORDER BY n.confidence DESC
-                """
-                
-                all_nodes = session.run(query).data()
-                
-                # Filter and score nodes by audience relevance
-                audience_nodes = []
-                for node in all_nodes:
-                    try:
-                        audience_data = json.loads(node['audience_relevance_json'])
-                        relevance_score = audience_data.get(audience, 0)
-                        
-                        # Only include nodes with meaningful relevance (>0.1)
-                        if relevance_score > 0.1:
-                            node['relevance_score'] = relevance_score
-                            # Boost score for insights vs metrics for better storytelling
-                            if node['type'] == 'insight':
-                                node['relevance_score'] *= 1.2
-                            audience_nodes.append(node)
-                    except (json.JSONDecodeError, KeyError):
-                        continue
-                
-                if not audience_nodes:
-                    return {'audience': audience, 'nodes': [], 'edges': [], 'total_nodes': 0, 'total_edges': 0}
-                
-                # Sort by relevance and confidence, then limit for focused view
-                audience_nodes.sort(key=lambda x: (x['relevance_score'], x['confidence']), reverse=True)
-                focused_nodes = audience_nodes[:limit]
-                
-                # Create a more connected subgraph by expanding to include related nodes
-                focused_node_ids = [node['id'] for node in focused_nodes]
-                
-                # Find additional highly connected nodes that connect to our focused nodes
-                expansion_query = """
-                MATCH (focused:Node)-[r:RELATES_TO]-(connected:Node)
-                WHERE focused.id IN $focused_ids 
-                  AND NOT connected.id IN $focused_ids
-                  AND r.weight >= 0.4
-                WITH connected, count(r) as connection_count, avg(r.weight) as avg_weight
+                WITH n, coalesce(n[$audience_key], 0) AS score
+                WHERE score > 0.1
+                // Boost score for insights vs metrics for better storytelling
+                WITH n, CASE n.type WHEN 'insight' THEN score * 1.2 ELSE score END AS relevance_score
+                ORDER BY relevance_score DESC, n.confidence DESC
+                LIMIT $limit
+                RETURN collect(n) AS focused, collect(relevance_score) AS scores
+            }
+            CALL {
+                // Find additional highly connected nodes that connect to our focused nodes
+                // (membership is tested against node lists, never against id lists passed back in)
+                WITH focused
+                UNWIND focused AS f
+                MATCH (f)-[r:RELATES_TO]-(connected:Node)
+                WHERE NOT connected IN focused AND r.weight >= 0.4
+                WITH connected, count(r) AS connection_count, avg(r.weight) AS avg_weight
                 ORDER BY connection_count DESC, avg_weight DESC
                 LIMIT 10
-                RETURN connected.id as id, connected.type as type, connected.content as content,
-                       connected.source as source, connected.confidence as confidence, 
-                       connected.tags as tags, connected.audience_relevance_json as audience_relevance_json,
-                       connected.value as value, connection_count, avg_weight
-                """
-                
-                expansion_nodes = session.run(expansion_query, {
-                    'focused_ids': focused_node_ids
-                }).data()
-                
-                # Add expansion nodes with connection info
-                for exp_node in expansion_nodes:
-                    exp_node['relevance_score'] = 0.3  # Lower relevance for expansion nodes
-                    exp_node['is_expansion'] = True
-                    focused_nodes.append(exp_node)
-                
-                all_node_ids = [node['id'] for node in focused_nodes]
-                
-                # Get edges with better filtering for meaningful connections
-                edges_query = """
-                MATCH (source:Node)-[r:RELATES_TO]-(target:Node)
-                WHERE source.id IN $node_ids AND target.id IN $node_ids
-                  AND r.weight >= 0.35
+                RETURN collect({node: connected, connection_count: connection_count, avg_weight: avg_weight}) AS expansion
+            }
+            CALL {
+                // Edges with better filtering for meaningful connections
+                WITH focused, expansion
+                WITH focused + [e IN expansion | e.node] AS members
+                UNWIND members AS source
+                MATCH (source)-[r:RELATES_TO]-(target:Node)
+                WHERE target IN members AND r.weight >= 0.35
                 WITH source, target, r
                 ORDER BY r.weight DESC
-                RETURN source.id as source_id, target.id as target_id,
-                       r.weight as weight, r.relationship_type as relationship_type,
-                       r.confidence as confidence, r.semantic_similarity as semantic_similarity,
-                       r.metadata_json as metadata_json
                 LIMIT 100
-                """
-                
-                edges = session.run(edges_query, {'node_ids': all_node_ids}).data()
-                
-                # Add audience-specific metadata
-                result = {
-                    'audience': audience,
-                    'nodes': focused_nodes,
-                    'edges': edges,
-                    'total_nodes': len(focused_nodes),
-                    'total_edges': len(edges),
-                    'focus_metadata': {
-                        'original_relevant_nodes': len(audience_nodes),
-                        'focused_nodes': len([n for n in focused_nodes if not n.get('is_expansion', False)]),
-                        'expansion_nodes': len([n for n in focused_nodes if n.get('is_expansion', False)]),
-                        'avg_relevance': sum(n['relevance_score'] for n in focused_nodes) / len(focused_nodes) if focused_nodes else 0,
-                        'audience_insights': self._get_audience_insights(audience, focused_nodes)
-                    }
-                }
-                
-                logger.info(f"✅ Generated {audience} graph: {len(focused_nodes)} nodes, {len(edges)} edges")
-                return result
-                
-            except Exception as e:
-                logger.error(f"Audience graph failed for {audience}: {e}")
+                RETURN collect({
+                    source_id: source.id, target_id: target.id,
+                    weight: r.weight, relationship_type: r.relationship_type,
+                    confidence: r.confidence, semantic_similarity: r.semantic_similarity,
+                    metadata_json: r.metadata_json
+                }) AS edges
+            }
+            RETURN relevant_total,
+                   [i IN range(0, size(focused) - 1) | {
+                       id: focused[i].id, type: focused[i].type, content: focused[i].content,
+                       source: focused[i].source, confidence: focused[i].confidence, tags: focused[i].tags,
+                       audience_relevance_json: focused[i].audience_relevance_json, value: focused[i].value,
+                       relevance_score: scores[i]
+                   }] AS focused_nodes,
+                   [e IN expansion | {
+                       id: e.node.id, type: e.node.type, content: e.node.content,
+                       source: e.node.source, confidence: e.node.confidence, tags: e.node.tags,
+                       audience_relevance_json: e.node.audience_relevance_json, value: e.node.value,
+                       connection_count: e.connection_count, avg_weight: e.avg_weight
+                   }] AS expansion_nodes,
+                   edges
+            """
+            
+            record = self._query_single(query, {
+                'audience_key': f'audience_{audience}',
+                'limit': limit
+            })
+            
+            if not record or not record['focused_nodes']:
                 return {'audience': audience, 'nodes': [], 'edges': [], 'total_nodes': 0, 'total_edges': 0}
+            
+            original_relevant_nodes = record['relevant_total']
+            focused_nodes = record['focused_nodes']
+            expansion_nodes = record['expansion_nodes']
+            edges = record['edges']
+            
+            # Rows arrive already ranked and limited by the server; only the counts are needed here
+            focused_count = len(focused_nodes)
+            total_relevance = sum(n['relevance_score'] for n in focused_nodes)
+            
+            # Add expansion nodes with connection info (set lookup keeps this O(1) per node)
+            focused_id_set = {node['id'] for node in focused_nodes}
+            expansion_nodes = [node for node in expansion_nodes if node['id'] not in focused_id_set]
+            for exp_node in expansion_nodes:
+                exp_node['relevance_score'] = 0.3  # Lower relevance for expansion nodes
+                exp_node['is_expansion'] = True
+            focused_nodes.extend(expansion_nodes)
+            total_relevance += 0.3 * len(expansion_nodes)
+            
+            # Add audience-specific metadata
+            result = {
+                'audience': audience,
+                'nodes': focused_nodes,
+                'edges': edges,
+                'total_nodes': len(focused_nodes),
+                'total_edges': len(edges),
+                'focus_metadata': {
+                    'original_relevant_nodes': original_relevant_nodes,
+                    'focused_nodes': focused_count,
+                    'expansion_nodes': len(expansion_nodes),
+                    'avg_relevance': total_relevance / len(focused_nodes),
+                    'audience_insights': self._get_audience_insights(audience, focused_nodes)
+                }
+            }
+            
+            logger.info(f"✅ Generated {audience} graph: {len(focused_nodes)} nodes, {len(edges)} edges")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Audience graph failed for {audience}: {e}")
+            return {'audience': audience, 'nodes': [], 'edges': [], 'total_nodes': 0, 'total_edges': 0}
     
     def _get_audience_insights(self, audience: str, nodes: List[Dict]) -> Dict:
         """Generate audience-specific insights from the nodes"""
@@ -453,41 +1075,35 @@ class Neo4jGraphClient:
             'confidence_distribution': {'high': 0, 'medium': 0, 'low': 0}
         }
         
+        if not nodes:
+            return insights
+        
         try:
-            for node in nodes:
-                # Count categories from tags
-                if 'tags' in node and node['tags']:
-                    for tag in node['tags']:
-                        if tag.startswith('category_'):
-                            category = tag.replace('category_', '')
-                            insights['top_categories'][category] = insights['top_categories'].get(category, 0) + 1
-                
-                # Collect high-value metrics/insights
-                if node.get('relevance_score', 0) > 0.6 and len(insights['key_metrics']) < 5:
-                    insights['key_metrics'].append({
-                        'content': node['content'],
-                        'relevance': node['relevance_score'],
-                        'type': node['type']
-                    })
-                
-                # Count data sources
-                source = node.get('source', 'unknown')
-                insights['data_sources'][source] = insights['data_sources'].get(source, 0) + 1
-                
-                # Confidence distribution
-                confidence = node.get('confidence', 0)
-                if confidence >= 0.8:
-                    insights['confidence_distribution']['high'] += 1
-                elif confidence >= 0.6:
-                    insights['confidence_distribution']['medium'] += 1
-                else:
-                    insights['confidence_distribution']['low'] += 1
+            df = pd.DataFrame(nodes)
+            
+            # Count categories from tags
+            if 'tags' in df:
+                tags = df['tags'].explode().dropna().astype(str)
+                categories = tags[tags.str.startswith('category_')].str[len('category_'):]
+                insights['top_categories'] = {k: int(v) for k, v in categories.value_counts().head(3).items()}
+            
+            # Collect high-value metrics/insights
+            if 'relevance_score' in df:
+                key_nodes = df.loc[df['relevance_score'].fillna(0) > 0.6, ['content', 'relevance_score', 'type']].head(5)
+                insights['key_metrics'] = [
+                    {'content': content, 'relevance': float(relevance), 'type': node_type}
+                    for content, relevance, node_type in key_nodes.itertuples(index=False)
+                ]
+            
+            # Count data sources
+            sources = df['source'] if 'source' in df else pd.Series('unknown', index=df.index)
+            insights['data_sources'] = {k: int(v) for k, v in sources.fillna('unknown').value_counts().head(5).items()}
             
-            # Sort categories and sources by count
-            insights['top_categories'] = dict(sorted(insights['top_categories'].items(), 
-                                                   key=lambda x: x[1], reverse=True)[:3])
-            insights['data_sources'] = dict(sorted(insights['data_sources'].items(), 
-                                                 key=lambda x: x[1], reverse=True)[:5])
+            # Confidence distribution
+            confidence = df['confidence'] if 'confidence' in df else pd.Series(0.0, index=df.index)
+            bins = pd.cut(confidence.fillna(0), bins=[-np.inf, 0.6, 0.8, np.inf],
+                          labels=['low', 'medium', 'high'], right=False)
+            insights['confidence_distribution'].update({k: int(v) for k, v in bins.value_counts().items()})
             
         except Exception as e:
             logger.warning(f"Failed to generate insights for {audience}: {e}")
@@ -496,60 +1112,75 @@ class Neo4jGraphClient:
     
     def get_analytics_summary(self) -> Dict:
         """Get advanced analytics similar to Linkurious insights"""
-        with self.driver.session() as session:
-            # Most connected nodes (high centrality)
+        # Most connected nodes (high centrality)
+        centrality_query = """
+        MATCH (n:Node)
+        WITH n, COUNT { (n)-[:RELATES_TO]-() } as degree
+        ORDER BY degree DESC
+        LIMIT 10
+        RETURN collect({
+            id: n.id,
+            content: n.content,
+            type: n.type,
+            degree: degree
+        }) as top_connected_nodes
+        """
+        
+        # Strongest relationships
+        strong_relationships = """
+        MATCH (source:Node)-[r:RELATES_TO]->(target:Node)
+        WHERE r.weight >= 0.7
+        RETURN collect({
+            source_content: source.content,
+            target_content: target.content,
+            weight: r.weight,
+            relationship_type: r.relationship_type
+        }) as strong_relationships
+        ORDER BY r.weight DESC
+        LIMIT 20
+        """
+        
+        # Tag distribution
+        tag_distribution = """
+        MATCH (n:Node)
+        UNWIND n.tags as tag
+        RETURN tag, count(*) as frequency
+        ORDER BY frequency DESC
+        LIMIT 15
+        """
+        
+        if self.has_gds:
+            # Degree over the compact in-memory projection instead of expanding every relationship
+            self._ensure_gds_projection()
             centrality_query = """
-            MATCH (n:Node)
-            OPTIONAL MATCH (n)-[r:RELATES_TO]-()
-            WITH n, count(r) as degree
-            ORDER BY degree DESC
+            CALL gds.degree.stream($graph_name) YIELD nodeId, score
+            WITH gds.util.asNode(nodeId) AS n, score
+            ORDER BY score DESC
             LIMIT 10
             RETURN collect({
                 id: n.id,
                 content: n.content,
                 type: n.type,
-                degree: degree
+                degree: toInteger(score)
             }) as top_connected_nodes
             """
-            
-            # Strongest relationships
-            strong_relationships = """
-            MATCH (source:Node)-[r:RELATES_TO]->(target:Node)
-            WHERE r.weight >= 0.7
-            RETURN collect({
-                source_content: source.content,
-                target_content: target.content,
-                weight: r.weight,
-                relationship_type: r.relationship_type
-            }) as strong_relationships
-            ORDER BY r.weight DESC
-            LIMIT 20
-            """
-            
-            # Tag distribution
-            tag_distribution = """
-            MATCH (n:Node)
-            UNWIND n.tags as tag
-            RETURN tag, count(*) as frequency
-            ORDER BY frequency DESC
-            LIMIT 15
-            """
-            
-            centrality = session.run(centrality_query).single()['top_connected_nodes']
-            relationships = session.run(strong_relationships).single()['strong_relationships']
-            tags = session.run(tag_distribution).data()
-            
-            return {
-                'top_connected_nodes': centrality,
-                'strongest_relationships': relationships,
-                'tag_distribution': tags,
-                'generated_at': datetime.now().isoformat()
-            }
+        
+        centrality = self._query_single(centrality_query, {'graph_name': GDS_GRAPH_NAME})['top_connected_nodes']
+        relationships = self._query_single(strong_relationships)['strong_relationships']
+        tags = self._query(tag_distribution)
+        
+        return {
+            'top_connected_nodes': centrality,
+            'strongest_relationships': relationships,
+            'tag_distribution': tags,
+            'generated_at': datetime.now().isoformat()
+        }
 
 # Usage example and initialization
-def initialize_neo4j_graph(nodes_file: str, edges_file: str) -> Neo4jGraphClient:
-    """Initialize Neo4j with graph data"""
-    client = Neo4jGraphClient()
+def initialize_neo4j_graph(nodes_file: str, edges_file: str,
+                           client: Optional[Neo4jGraphClient] = None) -> Neo4jGraphClient:
+    """Initialize Neo4j with graph data (reusing `client` when one is already connected)"""
+    client = client or Neo4jGraphClient()
     
     try:
         # Setup database
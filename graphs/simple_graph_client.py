@@ -6,13 +6,149 @@ This provides the same functionality but with SQLite as the backend.
 import sqlite3
 import json
 import logging
-from typing import Dict, List, Optional, Any
+import queue
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Iterator
 from datetime import datetime
 import uuid
+from array import array
+
+try:
+    import orjson
+    JSON_LOADS = orjson.loads
+    JSON_DUMPS = lambda obj: orjson.dumps(obj).decode()
+except ImportError:
+    JSON_LOADS = json.loads
+    JSON_DUMPS = json.dumps
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# WAL journaling with relaxed fsync, in-memory temp tables, a 64MB page cache and 256MB mmap
+CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# Reader connections in the pool; under WAL they query in parallel with each other and the writer
+MAX_READERS = 4
+
+# Rows per executemany call while streaming JSON into SQLite
+BATCH_SIZE = 1000
+
+# Table definitions, shared by create_tables and the legacy schema migration
+NODES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS nodes (
+        nid INTEGER PRIMARY KEY,  -- compact surrogate key used by edges
+        id TEXT UNIQUE NOT NULL,
+        type TEXT,
+        content TEXT,
+        value REAL,
+        timestamp TEXT,
+        confidence REAL,
+        source TEXT,
+        tags TEXT,  -- JSON array as string
+        audience_relevance_json TEXT,
+        embedding BLOB,  -- packed float32 vector
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+EDGES_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS edges (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        source_nid INTEGER,
+        target_nid INTEGER,
+        relationship_type TEXT,
+        weight REAL,
+        confidence REAL,
+        semantic_similarity REAL,
+        metadata_json TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (source_nid) REFERENCES nodes (nid),
+        FOREIGN KEY (target_nid) REFERENCES nodes (nid)
+    )
+"""
+
+# Bulk insert statements shared by the JSON loaders.
+# Nodes upsert in place so their nid stays stable; edge endpoints are translated to nids on insert
+NODE_INSERT_SQL = """
+    INSERT INTO nodes
+    (id, type, content, value, timestamp, confidence, source, tags,
+     audience_relevance_json, embedding)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        type = excluded.type, content = excluded.content, value = excluded.value,
+        timestamp = excluded.timestamp, confidence = excluded.confidence,
+        source = excluded.source, tags = excluded.tags,
+        audience_relevance_json = excluded.audience_relevance_json,
+        embedding = excluded.embedding
+"""
+EDGE_INSERT_SQL = """
+    INSERT INTO edges
+    (source_nid, target_nid, relationship_type, weight, confidence,
+     semantic_similarity, metadata_json)
+    VALUES ((SELECT nid FROM nodes WHERE id = ?), (SELECT nid FROM nodes WHERE id = ?),
+            ?, ?, ?, ?, ?)
+"""
+
+# Columns of the node and edge rows in get_audience_focused_graph's compound result
+AUDIENCE_NODE_COLUMNS = ('id', 'type', 'content', 'source', 'confidence', 'tags',
+                         'audience_relevance_json', 'relevance_score')
+AUDIENCE_EDGE_COLUMNS = ('source_id', 'target_id', 'weight', 'relationship_type')
+
+# Audiences that get a json_extract expression index on audience_relevance_json
+INDEXED_AUDIENCES = ('investors', 'customers', 'internal_team', 'developer_community')
+
+def encode_embedding(embedding: Optional[List[float]]) -> Optional[bytes]:
+    """Pack an embedding into float32 bytes for the BLOB column"""
+    return array('f', embedding).tobytes() if embedding else None
+
+def decode_embedding(blob: Optional[bytes]) -> Optional[array]:
+    """Unpack a float32 embedding BLOB without parsing"""
+    if not blob:
+        return None
+    embedding = array('f')
+    embedding.frombytes(blob)
+    return embedding
+
+def build_node_row(node: Dict) -> tuple:
+    """Build the NODE_INSERT_SQL parameter tuple for a node"""
+    get = node.get
+    tags = get('tags')
+    audience_relevance = get('audience_relevance')
+    # Absent or empty sub-objects bind a constant instead of going through the serializer
+    return (
+        get('id'), get('type'), get('content'), get('value'), get('timestamp'),
+        get('confidence'), get('source'),
+        JSON_DUMPS(tags) if tags else '[]',
+        JSON_DUMPS(audience_relevance) if audience_relevance else '{}',
+        encode_embedding(get('embedding'))
+    )
+
+def build_edge_row(edge: Dict) -> tuple:
+    """Build the EDGE_INSERT_SQL parameter tuple for an edge"""
+    get = edge.get
+    metadata = get('metadata')
+    return (
+        get('source_id'), get('target_id'), get('relationship_type'), get('weight'),
+        get('confidence'), get('semantic_similarity'),
+        JSON_DUMPS(metadata) if metadata else '{}'
+    )
+
+def json_default(obj: Any) -> Any:
+    """json/orjson `default` hook that serializes sqlite3.Row results as objects"""
+    if isinstance(obj, sqlite3.Row):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class SimpleGraphClient:
     """
     Simple graph client using SQLite - much easier than Neo4j!
@@ -22,205 +158,332 @@ class SimpleGraphClient:
         """Initialize SQLite connection"""
         try:
             self.db_path = db_path
-            self.connection = sqlite3.connect(db_path, check_same_thread=False)
-            self.connection.row_factory = sqlite3.Row  # Enable dict-like access
+            # Memoized get_graph_overview result, reset by every write path
+            self._overview_cache = None
+            # Dedicated writer connection for schema changes and loads
+            self.connection = self._connect()
             self.create_tables()
+            self._readers = queue.Queue()
+            if db_path == ':memory:':
+                # Every in-memory connection is its own database, so reads share the writer
+                self._readers.put(self.connection)
+            else:
+                for _ in range(MAX_READERS):
+                    self._readers.put(self._connect())
             logger.info("✅ Successfully connected to SQLite database")
         except Exception as e:
             logger.error(f"❌ Failed to connect to SQLite: {e}")
             raise
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection to db_path"""
+        # isolation_level=None: no implicit transactions; write paths issue BEGIN IMMEDIATE/COMMIT
+        connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        connection.row_factory = sqlite3.Row  # Enable dict-like access
+        connection.executescript(CONNECTION_PRAGMAS)
+        # Connection-local scratch table for joining edges against a node id set
+        connection.execute("CREATE TEMP TABLE IF NOT EXISTS _ids (nid INTEGER PRIMARY KEY, id TEXT)")
+        return connection
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a reader connection from the pool"""
+        connection = self._readers.get()
+        try:
+            yield connection
+        finally:
+            self._readers.put(connection)
+    
     def create_tables(self):
-        """Create database tables"""
+        """Create database tables, running schema setup and migrations in one transaction"""
         cursor = self.connection.cursor()
-        
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            self._create_schema(cursor)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        logger.info("🔧 Database tables and indexes created")
+    
+    def _create_schema(self, cursor):
+        """Create tables, indexes and the FTS table, migrating legacy layouts in place"""
         # Create nodes table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS nodes (
-                id TEXT PRIMARY KEY,
-                type TEXT,
-                content TEXT,
-                value REAL,
-                timestamp TEXT,
-                confidence REAL,
-                source TEXT,
-                tags TEXT,  -- JSON array as string
-                audience_relevance_json TEXT,
-                embedding_json TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+        cursor.execute(NODES_TABLE_SQL)
+        
+        self._migrate_embeddings(cursor)
         
         # Create edges table
+        cursor.execute(EDGES_TABLE_SQL)
+        
+        migrated = self._migrate_node_ids(cursor)
+        self.create_indexes()
+        
+        # Full-text index over content and source, rebuilt from nodes after each load
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'nodes_fts'")
+        fts_exists = cursor.fetchone() is not None
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS edges (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_id TEXT,
-                target_id TEXT,
-                relationship_type TEXT,
-                weight REAL,
-                confidence REAL,
-                semantic_similarity REAL,
-                metadata_json TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (source_id) REFERENCES nodes (id),
-                FOREIGN KEY (target_id) REFERENCES nodes (id)
+            CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5(
+                content, source,
+                content='nodes', content_rowid='rowid',
+                tokenize='porter unicode61'
             )
         """)
-        
-        # Create indexes
+        if migrated or not fts_exists:
+            cursor.execute("INSERT INTO nodes_fts(nodes_fts) VALUES('rebuild')")
+    
+    def create_indexes(self):
+        """Create the secondary indexes on nodes and edges"""
+        cursor = self.connection.cursor()
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_source ON nodes(source)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_weight ON edges(weight)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_source ON edges(source_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id)")
-        
-        self.connection.commit()
-        logger.info("🔧 Database tables and indexes created")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_nodes_type_confidence ON nodes(type, confidence DESC)")
+        # The composite edge index also serves source_nid lookups, so the single-column one is dropped
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_st_weight ON edges(source_nid, target_nid, weight)")
+        cursor.execute("DROP INDEX IF EXISTS idx_edges_source")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_nid)")
+        for audience in INDEXED_AUDIENCES:
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_nodes_audience_{audience}
+                ON nodes(json_extract(audience_relevance_json, '$.{audience}'))
+            """)
+    
+    def drop_indexes(self):
+        """Drop the secondary indexes so a bulk load doesn't maintain them row by row"""
+        cursor = self.connection.cursor()
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'index' AND tbl_name IN ('nodes', 'edges') AND name LIKE 'idx_%'
+        """)
+        index_names = [row['name'] for row in cursor.fetchall()]
+        cursor.execute("BEGIN IMMEDIATE")
+        for name in index_names:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        cursor.execute("COMMIT")
     
     def close(self):
         """Close database connection"""
+        while not self._readers.empty():
+            reader = self._readers.get_nowait()
+            if reader is not self.connection:
+                reader.close()
         if self.connection:
             self.connection.close()
             logger.info("SQLite connection closed")
     
+    def _migrate_embeddings(self, cursor):
+        """Convert a legacy embedding_json column into the float32 embedding BLOB"""
+        cursor.execute("PRAGMA table_info(nodes)")
+        columns = {row['name'] for row in cursor.fetchall()}
+        if 'embedding_json' not in columns:
+            return
+        
+        logger.info("🔄 Migrating embeddings from JSON to float32 BLOBs")
+        if 'embedding' not in columns:
+            cursor.execute("ALTER TABLE nodes ADD COLUMN embedding BLOB")
+        cursor.execute("SELECT id, embedding_json FROM nodes WHERE embedding_json IS NOT NULL")
+        cursor.executemany(
+            "UPDATE nodes SET embedding = ? WHERE id = ?",
+            [(encode_embedding(JSON_LOADS(row['embedding_json'])), row['id']) for row in cursor.fetchall()]
+        )
+        cursor.execute("ALTER TABLE nodes DROP COLUMN embedding_json")
+    
+    def _migrate_node_ids(self, cursor) -> bool:
+        """Rebuild a legacy TEXT-keyed schema so edges reference nodes by INTEGER nid"""
+        cursor.execute("PRAGMA table_info(nodes)")
+        if 'nid' in {row['name'] for row in cursor.fetchall()}:
+            return False
+        
+        logger.info("🔄 Migrating nodes and edges to integer node ids")
+        cursor.execute("ALTER TABLE nodes RENAME TO nodes_legacy")
+        cursor.execute("ALTER TABLE edges RENAME TO edges_legacy")
+        cursor.execute(NODES_TABLE_SQL)
+        cursor.execute("""
+            INSERT INTO nodes (id, type, content, value, timestamp, confidence, source, tags,
+                               audience_relevance_json, embedding, created_at)
+            SELECT id, type, content, value, timestamp, confidence, source, tags,
+                   audience_relevance_json, embedding, created_at
+            FROM nodes_legacy
+            ORDER BY rowid
+        """)
+        cursor.execute(EDGES_TABLE_SQL)
+        cursor.execute("""
+            INSERT INTO edges (id, source_nid, target_nid, relationship_type, weight, confidence,
+                               semantic_similarity, metadata_json, created_at)
+            SELECT e.id, s.nid, t.nid, e.relationship_type, e.weight, e.confidence,
+                   e.semantic_similarity, e.metadata_json, e.created_at
+            FROM edges_legacy e
+            LEFT JOIN nodes s ON s.id = e.source_id
+            LEFT JOIN nodes t ON t.id = e.target_id
+        """)
+        cursor.execute("DROP TABLE edges_legacy")
+        cursor.execute("DROP TABLE nodes_legacy")
+        return True
+    
+    def get_node_embedding(self, node_id: str) -> Optional[array]:
+        """Get a node's embedding as a float32 array"""
+        with self._reader() as connection:
+            cursor = connection.cursor()
+            cursor.execute("SELECT embedding FROM nodes WHERE id = ?", (node_id,))
+            row = cursor.fetchone()
+            return decode_embedding(row['embedding']) if row else None
+    
     def clear_database(self):
         """Clear all nodes and edges"""
         cursor = self.connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
         cursor.execute("DELETE FROM edges")
         cursor.execute("DELETE FROM nodes")
-        self.connection.commit()
+        cursor.execute("INSERT INTO nodes_fts(nodes_fts) VALUES('rebuild')")
+        cursor.execute("COMMIT")
+        self._overview_cache = None
         logger.info("🗑️ Database cleared")
     
+    @staticmethod
+    def _iter_json_items(path: str, key: str) -> Iterator[Dict]:
+        """Yield the items of the top-level `key` array, streamed with ijson when it is installed"""
+        with open(path, 'rb') as f:
+            if ijson is not None:
+                # use_float: plain floats instead of Decimal, which sqlite3 can't bind
+                yield from ijson.items(f, f'{key}.item', use_float=True)
+            else:
+                yield from JSON_LOADS(f.read()).get(key, [])
+    
     def load_nodes_from_json(self, nodes_file: str) -> int:
-        """Load nodes from JSON file into SQLite"""
+        """Load nodes from JSON file into SQLite, streamed in batches of BATCH_SIZE"""
         logger.info(f"📥 Loading nodes from {nodes_file}")
         
-        with open(nodes_file, 'r') as f:
-            data = json.load(f)
-        
-        nodes = data.get('nodes', [])
-        loaded_count = 0
         cursor = self.connection.cursor()
+        cursor.execute("PRAGMA cache_spill=OFF")
+        cursor.execute("BEGIN IMMEDIATE")
+        loaded_count = 0
+        rows = []
+        try:
+            for node in self._iter_json_items(nodes_file, 'nodes'):
+                try:
+                    rows.append(build_node_row(node))
+                except Exception as e:
+                    logger.error(f"Failed to load node {node.get('id')}: {e}")
+                
+                if len(rows) >= BATCH_SIZE:
+                    cursor.executemany(NODE_INSERT_SQL, rows)
+                    loaded_count += len(rows)
+                    rows.clear()
+            
+            cursor.executemany(NODE_INSERT_SQL, rows)
+            loaded_count += len(rows)
+            cursor.execute("INSERT INTO nodes_fts(nodes_fts) VALUES('rebuild')")
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.execute("PRAGMA cache_spill=ON")
         
-        for node in nodes:
-            try:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO nodes 
-                    (id, type, content, value, timestamp, confidence, source, tags, 
-                     audience_relevance_json, embedding_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    node.get('id'),
-                    node.get('type'),
-                    node.get('content'),
-                    node.get('value'),
-                    node.get('timestamp'),
-                    node.get('confidence'),
-                    node.get('source'),
-                    json.dumps(node.get('tags', [])),
-                    json.dumps(node.get('audience_relevance', {})),
-                    json.dumps(node.get('embedding', []))
-                ))
-                loaded_count += 1
-            except Exception as e:
-                logger.error(f"Failed to load node {node.get('id')}: {e}")
-        
-        self.connection.commit()
+        self._overview_cache = None
         logger.info(f"✅ Loaded {loaded_count} nodes successfully")
         return loaded_count
     
     def load_edges_from_json(self, edges_file: str) -> int:
-        """Load edges from JSON file into SQLite"""
+        """Load edges from JSON file into SQLite, streamed in batches of BATCH_SIZE"""
         logger.info(f"📥 Loading edges from {edges_file}")
         
-        with open(edges_file, 'r') as f:
-            data = json.load(f)
-        
-        edges = data.get('edges', [])
-        loaded_count = 0
         cursor = self.connection.cursor()
+        cursor.execute("PRAGMA cache_spill=OFF")
+        cursor.execute("BEGIN IMMEDIATE")
+        loaded_count = 0
+        rows = []
+        try:
+            for edge in self._iter_json_items(edges_file, 'edges'):
+                try:
+                    rows.append(build_edge_row(edge))
+                except Exception as e:
+                    logger.error(f"Failed to load edge {edge.get('source_id')} -> {edge.get('target_id')}: {e}")
+                
+                if len(rows) >= BATCH_SIZE:
+                    cursor.executemany(EDGE_INSERT_SQL, rows)
+                    loaded_count += len(rows)
+                    rows.clear()
+            
+            cursor.executemany(EDGE_INSERT_SQL, rows)
+            loaded_count += len(rows)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            cursor.execute("PRAGMA cache_spill=ON")
         
-        for edge in edges:
-            try:
-                cursor.execute("""
-                    INSERT INTO edges 
-                    (source_id, target_id, relationship_type, weight, confidence, 
-                     semantic_similarity, metadata_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    edge.get('source_id'),
-                    edge.get('target_id'),
-                    edge.get('relationship_type'),
-                    edge.get('weight'),
-                    edge.get('confidence'),
-                    edge.get('semantic_similarity'),
-                    json.dumps(edge.get('metadata', {}))
-                ))
-                loaded_count += 1
-            except Exception as e:
-                logger.error(f"Failed to load edge {edge.get('source_id')} -> {edge.get('target_id')}: {e}")
-        
-        self.connection.commit()
+        self._overview_cache = None
         logger.info(f"✅ Loaded {loaded_count} edges successfully")
         return loaded_count
     
     def get_graph_overview(self) -> Dict[str, Any]:
-        """Get comprehensive graph statistics"""
-        cursor = self.connection.cursor()
-        
-        # Total counts
-        cursor.execute("SELECT COUNT(*) as total FROM nodes")
-        total_nodes = cursor.fetchone()['total']
-        
-        cursor.execute("SELECT COUNT(*) as total FROM edges")
-        total_relationships = cursor.fetchone()['total']
+        """Get comprehensive graph statistics, cached until the next write"""
+        if self._overview_cache is not None:
+            return self._overview_cache
         
-        # Node counts by type
-        cursor.execute("""
-            SELECT type, COUNT(*) as count 
-            FROM nodes 
-            GROUP BY type 
-            ORDER BY count DESC
-        """)
-        node_types = [dict(row) for row in cursor.fetchall()]
-        
-        # Top sources
-        cursor.execute("""
-            SELECT source, COUNT(*) as count 
-            FROM nodes 
-            WHERE source IS NOT NULL
-            GROUP BY source 
-            ORDER BY count DESC 
-            LIMIT 10
-        """)
-        top_sources = [dict(row) for row in cursor.fetchall()]
-        
-        # High confidence nodes
-        cursor.execute("SELECT COUNT(*) as count FROM nodes WHERE confidence >= 0.8")
-        high_confidence = cursor.fetchone()['count']
-        
-        return {
-            'total_nodes': total_nodes,
-            'total_relationships': total_relationships,
-            'node_types': node_types,
-            'top_sources': top_sources,
-            'high_confidence_nodes': high_confidence,
-            'generated_at': datetime.now().isoformat()
-        }
+        with self._reader() as connection:
+            cursor = connection.cursor()
+            
+            # Scalar counts in one round-trip
+            cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM nodes) AS total_nodes,
+                       (SELECT COUNT(*) FROM edges) AS total_relationships,
+                       (SELECT COUNT(*) FROM nodes WHERE confidence >= 0.8) AS high_confidence
+            """)
+            total_nodes, total_relationships, high_confidence = cursor.fetchone()
+            
+            # Node counts by type
+            cursor.execute("""
+                SELECT type, COUNT(*) as count 
+                FROM nodes 
+                GROUP BY type 
+                ORDER BY count DESC
+            """)
+            node_types = cursor.fetchall()
+            
+            # Top sources
+            cursor.execute("""
+                SELECT source, COUNT(*) as count 
+                FROM nodes 
+                WHERE source IS NOT NULL
+                GROUP BY source 
+                ORDER BY count DESC 
+                LIMIT 10
+            """)
+            top_sources = cursor.fetchall()
+            
+            self._overview_cache = {
+                'total_nodes': total_nodes,
+                'total_relationships': total_relationships,
+                'node_types': node_types,
+                'top_sources': top_sources,
+                'high_confidence_nodes': high_confidence,
+                'generated_at': datetime.now().isoformat()
+            }
+            return self._overview_cache
     
-    def search_nodes(self, query: str, limit: int = 50) -> List[Dict]:
-        """Search nodes by content"""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT id, type, content, source, tags, confidence, value, timestamp
-            FROM nodes
-            WHERE content LIKE ? OR source LIKE ?
-            ORDER BY confidence DESC
-            LIMIT ?
-        """, (f'%{query}%', f'%{query}%', limit))
-        
-        return [dict(row) for row in cursor.fetchall()]
+    def search_nodes(self, query: str, limit: int = 50) -> List[sqlite3.Row]:
+        """Search nodes by content via the FTS5 index"""
+        # Quote each term so user input can't inject FTS syntax; trailing * allows prefix matches
+        terms = ['"' + term.replace('"', '""') + '"*' for term in query.split()]
+        if not terms:
+            return []
+        
+        with self._reader() as connection:
+            cursor = connection.cursor()
+            cursor.execute("""
+                SELECT n.id, n.type, n.content, n.source, n.tags, n.confidence, n.value, n.timestamp
+                FROM nodes_fts f
+                JOIN nodes n ON n.rowid = f.rowid
+                WHERE nodes_fts MATCH ?
+                ORDER BY bm25(nodes_fts)
+                LIMIT ?
+            """, (' '.join(terms), limit))
+            
+            return cursor.fetchall()
     
     def get_filtered_graph(self, 
                           node_types: List[str] = None,
@@ -229,118 +492,132 @@ class SimpleGraphClient:
                           min_weight: float = 0.3,
                           tags: List[str] = None,
                           limit: int = 100) -> Dict:
-        """Get filtered graph data"""
-        cursor = self.connection.cursor()
-        
-        # Build dynamic query
-        conditions = ["confidence >= ?"]
-        params = [min_confidence]
-        
-        if node_types:
-            placeholders = ','.join('?' for _ in node_types)
-            conditions.append(f"type IN ({placeholders})")
-            params.extend(node_types)
-        
-        if sources:
-            placeholders = ','.join('?' for _ in sources)
-            conditions.append(f"source IN ({placeholders})")
-            params.extend(sources)
-        
-        where_clause = " AND ".join(conditions)
-        params.append(limit)
-        
-        # Get filtered nodes
-        cursor.execute(f"""
-            SELECT id, type, content, source, confidence, value, tags, audience_relevance_json
-            FROM nodes
-            WHERE {where_clause}
-            ORDER BY confidence DESC
-            LIMIT ?
-        """, params)
-        
-        nodes = [dict(row) for row in cursor.fetchall()]
-        node_ids = [node['id'] for node in nodes]
-        
-        # Get relationships between filtered nodes
-        edges = []
-        if node_ids:
-            placeholders = ','.join('?' for _ in node_ids)
+        """Get filtered graph data; nodes and edges are sqlite3.Row results"""
+        with self._reader() as connection:
+            cursor = connection.cursor()
+            
+            # Build dynamic query
+            conditions = ["confidence >= ?"]
+            params = [min_confidence]
+            
+            # List filters bind as one JSON array each, so the statement text only varies by
+            # which filters are present and stays in sqlite3's statement cache
+            if node_types:
+                conditions.append("type IN (SELECT value FROM json_each(?))")
+                params.append(JSON_DUMPS(node_types))
+            
+            if sources:
+                conditions.append("source IN (SELECT value FROM json_each(?))")
+                params.append(JSON_DUMPS(sources))
+            
+            where_clause = " AND ".join(conditions)
+            params.append(limit)
+            
+            # Stage the filtered node set in _ids, then read the nodes back from it
+            cursor.execute("DELETE FROM _ids")
             cursor.execute(f"""
-                SELECT source_id, target_id, weight, confidence, semantic_similarity, 
-                       relationship_type, metadata_json
-                FROM edges
-                WHERE source_id IN ({placeholders}) AND target_id IN ({placeholders})
-                  AND weight >= ?
-                ORDER BY weight DESC
-            """, node_ids + node_ids + [min_weight])
+                INSERT INTO _ids
+                SELECT nid, id
+                FROM nodes
+                WHERE {where_clause}
+                ORDER BY confidence DESC
+                LIMIT ?
+            """, params)
+            cursor.execute("""
+                SELECT n.id, n.type, n.content, n.source, n.confidence, n.value, n.tags, n.audience_relevance_json
+                FROM _ids i
+                JOIN nodes n ON n.nid = i.nid
+                ORDER BY n.confidence DESC
+            """)
             
-            edges = [dict(row) for row in cursor.fetchall()]
-        
-        return {
-            'nodes': nodes,
-            'edges': edges,
-            'total_nodes': len(nodes),
-            'total_edges': len(edges)
-        }
+            nodes = cursor.fetchall()
+            
+            # Get relationships between filtered nodes
+            edges = []
+            if nodes:
+                cursor.execute("""
+                    SELECT s.id AS source_id, t.id AS target_id, e.weight, e.confidence, e.semantic_similarity, 
+                           e.relationship_type, e.metadata_json
+                    FROM edges e
+                    JOIN _ids s ON e.source_nid = s.nid
+                    JOIN _ids t ON e.target_nid = t.nid
+                    WHERE e.weight >= ?
+                    ORDER BY e.weight DESC
+                """, (min_weight,))
+            
+                edges = cursor.fetchall()
+            
+            return {
+                'nodes': nodes,
+                'edges': edges,
+                'total_nodes': len(nodes),
+                'total_edges': len(edges)
+            }
     
     def get_audience_focused_graph(self, audience: str, limit: int = 100) -> Dict:
         """Get graph focused on specific audience"""
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            SELECT id, type, content, source, confidence, tags, audience_relevance_json
-            FROM nodes
-            WHERE audience_relevance_json IS NOT NULL
-            ORDER BY confidence DESC
-        """)
-        
-        all_nodes = [dict(row) for row in cursor.fetchall()]
-        
-        # Filter by audience in Python
-        relevant_nodes = []
-        for node in all_nodes:
-            try:
-                audience_data = json.loads(node['audience_relevance_json'])
-                if audience_data.get(audience, 0) > 0.0:
-                    node['relevance_score'] = audience_data[audience]
-                    relevant_nodes.append(node)
-            except (json.JSONDecodeError, KeyError):
-                continue
-        
-        # Sort and limit
-        relevant_nodes.sort(key=lambda x: x['relevance_score'], reverse=True)
-        relevant_nodes = relevant_nodes[:limit]
-        
-        # Get edges
-        edges = []
-        if relevant_nodes:
-            node_ids = [node['id'] for node in relevant_nodes]
-            placeholders = ','.join('?' for _ in node_ids)
+        with self._reader() as connection:
+            cursor = connection.cursor()
+            
+            # Indexed audiences use the literal path so SQLite can match the expression index
+            if audience in INDEXED_AUDIENCES:
+                score_expr = f"json_extract(audience_relevance_json, '$.{audience}')"
+                params = (limit,)
+            else:
+                score_expr = "json_extract(audience_relevance_json, ?)"
+                params = (f'$."{audience}"', limit)
+            
+            # Select the top nodes once, then return them and the edges among them in one
+            # compound result; the kind column tells the two row shapes apart
             cursor.execute(f"""
-                SELECT source_id, target_id, weight, relationship_type
-                FROM edges
-                WHERE source_id IN ({placeholders}) AND target_id IN ({placeholders})
-                  AND weight >= 0.3
-                ORDER BY weight DESC
-            """, node_ids + node_ids)
+                WITH sel AS MATERIALIZED (
+                    SELECT nid, id, type, content, source, confidence, tags, audience_relevance_json,
+                           {score_expr} AS relevance_score
+                    FROM nodes
+                    WHERE relevance_score > 0
+                    ORDER BY relevance_score DESC, confidence DESC
+                    LIMIT ?
+                )
+                SELECT 'node' AS kind, id, type, content, source, confidence, tags,
+                       audience_relevance_json, relevance_score,
+                       NULL AS source_id, NULL AS target_id, NULL AS weight, NULL AS relationship_type
+                FROM sel
+                UNION ALL
+                SELECT 'edge', NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL,
+                       s.id, t.id, e.weight, e.relationship_type
+                FROM edges e
+                JOIN sel s ON e.source_nid = s.nid
+                JOIN sel t ON e.target_nid = t.nid
+                WHERE e.weight >= 0.3
+                ORDER BY kind DESC, relevance_score DESC, confidence DESC, weight DESC
+            """, params)
             
-            edges = [dict(row) for row in cursor.fetchall()]
-        
-        return {
-            'audience': audience,
-            'nodes': relevant_nodes,
-            'edges': edges,
-            'total_nodes': len(relevant_nodes),
-            'total_edges': len(edges)
-        }
+            relevant_nodes = []
+            edges = []
+            for row in cursor.fetchall():
+                if row['kind'] == 'node':
+                    relevant_nodes.append({key: row[key] for key in AUDIENCE_NODE_COLUMNS})
+                else:
+                    edges.append({key: row[key] for key in AUDIENCE_EDGE_COLUMNS})
+            
+            return {
+                'audience': audience,
+                'nodes': relevant_nodes,
+                'edges': edges,
+                'total_nodes': len(relevant_nodes),
+                'total_edges': len(edges)
+            }
 
 def initialize_simple_graph(nodes_file: str, edges_file: str) -> SimpleGraphClient:
     """Initialize SQLite graph with data"""
     client = SimpleGraphClient()
     
     try:
-        # Load data
+        # Load data with indexes dropped, then rebuild them in one sorted pass each
+        client.drop_indexes()
         client.load_nodes_from_json(nodes_file)
         client.load_edges_from_json(edges_file)
+        client.create_indexes()
         
         # Get overview
         overview = client.get_graph_overview()
@@ -361,6 +638,6 @@ if __name__ == "__main__":
     )
     
     overview = client.get_graph_overview()
-    print(json.dumps(overview, indent=2))
+    print(json.dumps(overview, indent=2, default=json_default))
     
     client.close() 
\ No newline at end of file
@@ -11,6 +11,22 @@ class GraphVisualization {
         this.currentData = { nodes: [], edges: [] };
         this.selectedNode = null;
         this.analytics = null;
+        this.enums = null;
+        
+        // DOM references reused on every update
+        this.statEls = {
+            totalNodes: document.getElementById('total-nodes'),
+            totalEdges: document.getElementById('total-edges'),
+            visibleNodes: document.getElementById('visible-nodes'),
+            visibleEdges: document.getElementById('visible-edges')
+        };
+        // Filter checkboxes per container, refreshed by populateCheckboxGroup
+        this.checkboxGroups = {};
+        this.setupActivityLog();
+        
+        // In-flight requests; a newer filter/search cancels the older one
+        this.filterAbort = null;
+        this.searchAbort = null;
         
         // Initialize the application
         this.init();
@@ -88,17 +104,12 @@ class GraphVisualization {
             const overview = await overviewResponse.json();
             
             // Load initial filtered graph
-            const graphResponse = await fetch('/api/graph/filtered', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    min_confidence: 0.0,
-                    min_weight: 0.3,
-                    limit: 100
-                })
+            const graphData = await this.fetchFilteredGraph({
+                min_confidence: 0.0,
+                min_weight: 0.3,
+                limit: 100,
+                compact: true
             });
-            
-            const graphData = await graphResponse.json();
             this.currentData = graphData;
             
             this.updateGraphData(graphData);
@@ -109,6 +120,57 @@ class GraphVisualization {
         }
     }
     
+    async fetchFilteredGraph(filters, signal) {
+        // NDJSON stream: lines are parsed as they arrive instead of after the whole body
+        const response = await fetch('/api/graph/filtered/stream', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(filters),
+            signal
+        });
+        if (!response.ok) throw new Error(`Filtered graph request failed: ${response.status}`);
+        
+        const data = { nodes: [], edges: [] };
+        const handleLine = (line) => {
+            if (!line) return;
+            const { kind, ...item } = JSON.parse(line);
+            if (kind === 'node') data.nodes.push(item);
+            else if (kind === 'edge') data.edges.push(item);
+            else Object.assign(data, item);
+        };
+        
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += value;
+            let newline;
+            while ((newline = buffer.indexOf('\n')) >= 0) {
+                handleLine(buffer.slice(0, newline));
+                buffer = buffer.slice(newline + 1);
+            }
+        }
+        handleLine(buffer);
+        // Each compact payload carries the type/source lists its codes index into
+        if (data.enums) this.enums = data.enums;
+        return data;
+    }
+    
+    hasServerLayout(data) {
+        return data.nodes.length > 0 && data.nodes.every(node => node.x != null && node.y != null);
+    }
+    
+    decodeNode(node) {
+        // Compact payloads carry type/source as codes into this.enums
+        if (node.type_code === undefined || !this.enums) return node;
+        return {
+            ...node,
+            type: this.enums.types[node.type_code],
+            source: this.enums.sources[node.source_code]
+        };
+    }
+    
     async loadFilters() {
         try {
             // Load available node types
@@ -130,6 +192,9 @@ class GraphVisualization {
         const container = document.getElementById(containerId);
         container.innerHTML = '';
         
+        // Build off-document, then attach once (one layout instead of one per item)
+        const fragment = document.createDocumentFragment();
+        const checkboxes = [];
         items.forEach(item => {
             if (item) {
                 const label = document.createElement('label');
@@ -140,9 +205,12 @@ class GraphVisualization {
                 
                 label.appendChild(checkbox);
                 label.appendChild(document.createTextNode(item));
-                container.appendChild(label);
+                fragment.appendChild(label);
+                checkboxes.push(checkbox);
             }
         });
+        container.appendChild(fragment);
+        this.checkboxGroups[containerId] = checkboxes;
     }
     
     setupGraph() {
@@ -171,7 +239,8 @@ class GraphVisualization {
                 }
             },
             physics: {
-                enabled: true,
+                // Server-precomputed x/y make the simulation unnecessary
+                enabled: !this.hasServerLayout(this.currentData),
                 stabilization: { iterations: 100 },
                 barnesHut: {
                     gravitationalConstant: -2000,
@@ -204,7 +273,7 @@ class GraphVisualization {
     
     updateGraphData(data) {
         // Process nodes
-        const processedNodes = data.nodes.map(node => ({
+        const processedNodes = data.nodes.map(raw => this.decodeNode(raw)).map(node => ({
             id: node.id,
             label: this.truncateText(node.content, 30),
             title: this.createNodeTooltip(node),
@@ -225,6 +294,15 @@ class GraphVisualization {
             ...edge
         }));
         
+        // Use stored coordinates when every node has them, otherwise let physics lay the graph out
+        const serverLayout = this.hasServerLayout(data);
+        if (!serverLayout) {
+            processedNodes.forEach(node => { delete node.x; delete node.y; });
+        }
+        if (this.network) {
+            this.network.setOptions({ physics: { enabled: !serverLayout } });
+        }
+        
         // Update datasets
         this.nodes.clear();
         this.edges.clear();
@@ -329,6 +407,15 @@ class GraphVisualization {
             });
             
             const neighbors = await response.json();
+            
+            // Compact payloads only carry a content preview; the neighbor lookup has the full text
+            if (node.content_truncated && neighbors.center_content) {
+                node.content = neighbors.center_content;
+                node.content_truncated = false;
+                this.nodes.update({ id: nodeId, content: node.content, content_truncated: false });
+                this.displayNodeDetails(node);
+            }
+            
             this.highlightNeighbors(nodeId, neighbors);
             
         } catch (error) {
@@ -396,17 +483,22 @@ class GraphVisualization {
         const query = document.getElementById('search-input').value.trim();
         if (!query) return;
         
+        this.searchAbort?.abort();
+        const controller = this.searchAbort = new AbortController();
+        
         try {
             const response = await fetch('/api/search', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ query, limit: 20 })
+                body: JSON.stringify({ query, limit: 20 }),
+                signal: controller.signal
             });
             
             const results = await response.json();
             this.displaySearchResults(results.results);
             
         } catch (error) {
+            if (error.name === 'AbortError') return;  // superseded by a newer search
             console.error('Search failed:', error);
         }
     }
@@ -439,44 +531,43 @@ class GraphVisualization {
     async applyFilters() {
         const filters = this.getFilterValues();
         
+        this.filterAbort?.abort();
+        const controller = this.filterAbort = new AbortController();
+        
         try {
-            const response = await fetch('/api/graph/filtered', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(filters)
-            });
-            
-            const data = await response.json();
+            const data = await this.fetchFilteredGraph(filters, controller.signal);
             this.currentData = data;
             this.updateGraphData(data);
             this.updateGraphInfo(`Applied filters: ${data.total_nodes} nodes, ${data.total_edges} edges`);
             
         } catch (error) {
+            if (error.name === 'AbortError') return;  // superseded by newer filters
             console.error('Filter application failed:', error);
         }
     }
     
     getFilterValues() {
         // Get selected node types
-        const nodeTypes = Array.from(document.querySelectorAll('#node-types-filter input:checked'))
-            .map(cb => cb.value);
+        const nodeTypes = (this.checkboxGroups['node-types-filter'] || [])
+            .filter(cb => cb.checked).map(cb => cb.value);
         
         // Get selected sources
-        const sources = Array.from(document.querySelectorAll('#sources-filter input:checked'))
-            .map(cb => cb.value);
+        const sources = (this.checkboxGroups['sources-filter'] || [])
+            .filter(cb => cb.checked).map(cb => cb.value);
         
         return {
             node_types: nodeTypes.length > 0 ? nodeTypes : null,
             sources: sources.length > 0 ? sources : null,
             min_confidence: parseFloat(document.getElementById('confidence-slider').value),
             min_weight: parseFloat(document.getElementById('weight-slider').value),
-            limit: 100
+            limit: 100,
+            compact: true
         };
     }
     
     clearFilters() {
         // Reset all checkboxes
-        document.querySelectorAll('input[type="checkbox"]').forEach(cb => cb.checked = true);
+        Object.values(this.checkboxGroups).flat().forEach(cb => cb.checked = true);
         
         // Reset sliders
         document.getElementById('confidence-slider').value = 0;
@@ -583,10 +674,10 @@ class GraphVisualization {
     
     // Utility methods
     updateStats() {
-        document.getElementById('total-nodes').textContent = this.currentData.total_nodes || 0;
-        document.getElementById('total-edges').textContent = this.currentData.total_edges || 0;
-        document.getElementById('visible-nodes').textContent = this.nodes.length;
-        document.getElementById('visible-edges').textContent = this.edges.length;
+        this.statEls.totalNodes.textContent = this.currentData.total_nodes || 0;
+        this.statEls.totalEdges.textContent = this.currentData.total_edges || 0;
+        this.statEls.visibleNodes.textContent = this.nodes.length;
+        this.statEls.visibleEdges.textContent = this.edges.length;
     }
     
     updateGraphInfo(message) {
@@ -603,24 +694,38 @@ class GraphVisualization {
         this.showLoading(false);
     }
     
+    setupActivityLog(size = 10) {
+        // Fixed ring of activity rows, created once and recycled by logActivity
+        this.activityLog = document.getElementById('activity-log');
+        this.activityPlaceholder = this.activityLog.querySelector('p');
+        this.activityRing = Array.from({ length: size }, () => {
+            const item = document.createElement('div');
+            item.className = 'activity-item';
+            item.hidden = true;
+            item.innerHTML = '<span class="activity-text"></span><span class="activity-time"></span>';
+            this.activityLog.appendChild(item);
+            return {
+                item,
+                text: item.querySelector('.activity-text'),
+                time: item.querySelector('.activity-time')
+            };
+        });
+        this.activityIdx = 0;
+    }
+    
     logActivity(message) {
-        const log = document.getElementById('activity-log');
-        const time = new Date().toLocaleTimeString();
-        
-        const activityHtml = `
-            <div class="activity-item">
-                <span class="activity-text">${message}</span>
-                <span class="activity-time">${time}</span>
-            </div>
-        `;
-        
-        log.insertAdjacentHTML('afterbegin', activityHtml);
-        
-        // Keep only last 10 activities
-        const items = log.querySelectorAll('.activity-item');
-        if (items.length > 10) {
-            items[items.length - 1].remove();
+        if (this.activityPlaceholder) {
+            this.activityPlaceholder.remove();
+            this.activityPlaceholder = null;
         }
+        
+        // Reuse the oldest row: update its text and move it to the top (keeps the last 10)
+        const slot = this.activityRing[this.activityIdx];
+        slot.text.textContent = message;
+        slot.time.textContent = new Date().toLocaleTimeString();
+        slot.item.hidden = false;
+        this.activityLog.prepend(slot.item);
+        this.activityIdx = (this.activityIdx + 1) % this.activityRing.length;
     }
 }
 
@@ -0,0 +1,34 @@
+"""
+Round-trip the shipped graph data through the Parquet converter
+"""
+
+import os
+import sys
+import json
+import shutil
+
+import pytest
+
+pytest.importorskip("pyarrow")
+pytest.importorskip("neo4j")
+
+GRAPHS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GRAPHS_DIR)
+
+from neo4j_client import Neo4jGraphClient
+from setup_graph_platform import convert_to_parquet
+
+@pytest.mark.parametrize("path, key", [
+    ("nodes/flowmetrics_nodes.json", "nodes"),
+    ("edges/flowmetrics_edges.json", "edges"),
+])
+def test_shipped_data_round_trips(tmp_path, path, key):
+    """Every item read back from Parquet equals the item in the shipped JSON file"""
+    json_path = str(tmp_path / os.path.basename(path))
+    shutil.copyfile(os.path.join(GRAPHS_DIR, path), json_path)
+    
+    with open(json_path) as f:
+        expected = json.load(f)[key]
+    
+    parquet = convert_to_parquet(json_path, key)
+    assert list(Neo4jGraphClient._iter_json_items(parquet, key)) == expected
@@ -4,7 +4,10 @@ Comprehensive Graph Visualization System for Agentic Commerce
 Provides multiple visualization types for internal teams to understand semantic graph structure
 """
 
+import os
 import json
+import hashlib
+import pickle
 import pandas as pd
 import networkx as nx
 import matplotlib.pyplot as plt
@@ -14,7 +17,37 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import numpy as np
 from collections import defaultdict, Counter
-import textwrap
+from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+import re
+
+try:
+    import orjson
+    JSON_LOADS = orjson.loads
+except ImportError:
+    JSON_LOADS = json.loads
+
+try:
+    import igraph
+except ImportError:
+    igraph = None
+
+# Source nodes sampled for betweenness centrality; exact when the graph is no larger
+BETWEENNESS_SAMPLE_SIZE = 256
+
+# Above this many nodes the diameter is estimated with a double-sweep BFS instead of all-pairs paths
+DIAMETER_EXACT_MAX_NODES = 2000
+
+# Hover text line breaks: after each run of 50+ characters, at the next whitespace
+HOVER_WRAP_WIDTH = 50
+HOVER_WRAP_RE = re.compile(r'(.{%d}\S*)\s' % HOVER_WRAP_WIDTH)
+
+# Directory for pickled layouts, keyed by a hash of the graph structure (next to this module, whatever the cwd)
+LAYOUT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
+# write_html options: load plotly.js from the CDN (cached once across pages) instead of
+# inlining ~3MB per file, and skip re-validating figures we built ourselves
+WRITE_HTML_OPTIONS = dict(include_plotlyjs='cdn', full_html=True, validate=False)
 
 class GraphVisualizer:
     def __init__(self, nodes_file, edges_file, summary_file):
@@ -28,105 +61,259 @@ class GraphVisualizer:
         self.edges_data = self.load_json(edges_file)
         self.summary_data = self.load_json(summary_file)
         
+        # One pass over the nodes feeds the graph, the nodes DataFrame and the tag counts
+        node_attrs, self.nodes_df, tag_counts = self.process_nodes()
+        self._top_tags = tag_counts.most_common(10)
+        
         # Create NetworkX graph
-        self.graph = self.build_networkx_graph()
+        self.graph = self.build_networkx_graph(node_attrs)
         
         # Process data for visualizations
-        self.nodes_df = self.create_nodes_dataframe()
         self.edges_df = self.create_edges_dataframe()
         
     def load_json(self, filepath):
         """Load JSON data from file"""
         try:
-            with open(filepath, 'r') as f:
-                return json.load(f)
+            with open(filepath, 'rb') as f:
+                return JSON_LOADS(f.read())
         except Exception as e:
             print(f"Error loading {filepath}: {e}")
             return {}
     
-    def build_networkx_graph(self):
-        """Build NetworkX graph from our data"""
+    def build_networkx_graph(self, node_attrs):
+        """Build NetworkX graph from (id, attrs) node tuples and our edge data"""
         G = nx.Graph()
         
-        # Add nodes
-        for node in self.nodes_data.get('nodes', []):
-            G.add_node(
-                node['id'],
-                type=node['type'],
-                content=node['content'],
-                source=node['source'],
-                confidence=node['confidence'],
-                tags=node['tags'],
-                value=node.get('value', 0)
-            )
-        
-        # Add edges
-        for edge in self.edges_data.get('edges', []):
-            G.add_edge(
-                edge['source_id'],
-                edge['target_id'],
-                weight=edge['weight'],
-                relationship_type=edge['relationship_type'],
-                similarity=edge['semantic_similarity']
-            )
+        # Add nodes and edges in bulk as (id, attrs) / (u, v, attrs) tuples
+        G.add_nodes_from(node_attrs)
+        G.add_edges_from(
+            (edge['source_id'], edge['target_id'], {
+                'weight': edge['weight'],
+                'relationship_type': edge['relationship_type'],
+                'similarity': edge['semantic_similarity']
+            })
+            for edge in self.edges_data.get('edges', [])
+        )
         
         return G
     
-    def create_nodes_dataframe(self):
-        """Create pandas DataFrame for nodes analysis"""
-        nodes_list = []
-        for node in self.nodes_data.get('nodes', []):
-            node_data = {
-                'id': node['id'],
-                'type': node['type'],
-                'content': node['content'][:100] + '...' if len(node['content']) > 100 else node['content'],
-                'source': node['source'],
-                'confidence': node['confidence'],
-                'value': node.get('value', 0),
-                'tag_count': len(node['tags']),
-                'tags': ', '.join(node['tags'])
-            }
-            nodes_list.append(node_data)
-        
-        return pd.DataFrame(nodes_list)
+    def process_nodes(self):
+        """Walk the nodes once, returning graph attribute tuples, the nodes DataFrame and tag counts"""
+        nodes = self.nodes_data.get('nodes', [])
+        node_attrs = []
+        tag_counts = Counter()
+        num_nodes = len(nodes)
+        ids = np.empty(num_nodes, dtype=object)
+        types = np.empty(num_nodes, dtype=object)
+        contents = np.empty(num_nodes, dtype=object)
+        sources = np.empty(num_nodes, dtype=object)
+        confidence = np.empty(num_nodes, dtype=np.float32)
+        values = np.empty(num_nodes, dtype=object)  # some nodes carry a descriptive string
+        tag_count = np.empty(num_nodes, dtype=np.int32)
+        tags = np.empty(num_nodes, dtype=object)
+        
+        # Fill preallocated column arrays in one pass; no per-row dicts or dtype inference
+        for i, node in enumerate(nodes):
+            node_id = node['id']
+            node_type = node['type']
+            content = node['content']
+            source = node['source']
+            node_confidence = node['confidence']
+            value = node.get('value', 0)
+            node_tags = node['tags']
+            
+            node_attrs.append((node_id, {
+                'type': node_type,
+                'content': content,
+                'source': source,
+                'confidence': node_confidence,
+                'tags': node_tags,
+                'value': value
+            }))
+            tag_counts.update(node_tags)
+            
+            ids[i] = node_id
+            types[i] = node_type
+            contents[i] = content[:100] + '...' if len(content) > 100 else content
+            sources[i] = source
+            confidence[i] = node_confidence
+            values[i] = value
+            tag_count[i] = len(node_tags)
+            tags[i] = ', '.join(node_tags)
+        
+        # Low-cardinality strings become categoricals; numbers are kept at 32 bits
+        nodes_df = pd.DataFrame({
+            'id': ids,
+            'type': pd.Categorical(types),
+            'content': contents,
+            'source': pd.Categorical(sources),
+            'confidence': confidence,
+            'value': values,
+            'tag_count': tag_count,
+            'tags': tags
+        })
+        return node_attrs, nodes_df, tag_counts
     
     def create_edges_dataframe(self):
         """Create pandas DataFrame for edges analysis"""
-        edges_list = []
-        for edge in self.edges_data.get('edges', []):
-            edge_data = {
-                'source': edge['source_id'],
-                'target': edge['target_id'],
-                'weight': edge['weight'],
-                'similarity': edge['semantic_similarity'],
-                'relationship_type': edge['relationship_type'],
-                'confidence': edge['confidence']
-            }
-            edges_list.append(edge_data)
-        
-        return pd.DataFrame(edges_list)
+        edges = self.edges_data.get('edges', [])
+        num_edges = len(edges)
+        source = np.empty(num_edges, dtype=object)
+        target = np.empty(num_edges, dtype=object)
+        relationship_type = np.empty(num_edges, dtype=object)
+        weight = np.empty(num_edges, dtype=np.float32)
+        similarity = np.empty(num_edges, dtype=np.float32)
+        confidence = np.empty(num_edges, dtype=np.float32)
+        
+        for i, edge in enumerate(edges):
+            source[i] = edge['source_id']
+            target[i] = edge['target_id']
+            weight[i] = edge['weight']
+            similarity[i] = edge['semantic_similarity']
+            relationship_type[i] = edge['relationship_type']
+            confidence[i] = edge['confidence']
+        
+        return pd.DataFrame({
+            'source': source,
+            'target': target,
+            'weight': weight,
+            'similarity': similarity,
+            'relationship_type': pd.Categorical(relationship_type),
+            'confidence': confidence
+        })
+    
+    # Node counts and graph metrics, computed once per visualizer and shared by the
+    # dashboard, the relationship analysis and the insights report
+    
+    @cached_property
+    def type_counts(self):
+        """Node counts per type, most common first"""
+        return self.nodes_df['type'].value_counts()
+    
+    @cached_property
+    def source_counts(self):
+        """Node counts per source, most common first"""
+        return self.nodes_df['source'].value_counts()
+    
+    @cached_property
+    def degree_centrality(self):
+        """Degree centrality per node"""
+        return nx.degree_centrality(self.graph)
+    
+    @cached_property
+    def betweenness_centrality(self):
+        """Betweenness centrality per node, estimated from a sample of source nodes"""
+        k = min(self.graph.number_of_nodes(), BETWEENNESS_SAMPLE_SIZE)
+        return nx.betweenness_centrality(self.graph, k=k, normalized=True, seed=42)
+    
+    @cached_property
+    def closeness_centrality(self):
+        """Closeness centrality per node"""
+        return nx.closeness_centrality(self.graph, wf_improved=True)
+    
+    @cached_property
+    def density(self):
+        """Graph density"""
+        return nx.density(self.graph)
+    
+    @cached_property
+    def avg_clustering(self):
+        """Average clustering coefficient"""
+        return nx.average_clustering(self.graph)
+    
+    @cached_property
+    def connected_components(self):
+        """Connected components as node sets, traversed once for the count and the diameter"""
+        return list(nx.connected_components(self.graph))
+    
+    @cached_property
+    def num_ccs(self):
+        """Number of connected components"""
+        return len(self.connected_components)
+    
+    @cached_property
+    def diameter_or_na(self):
+        """Graph diameter, or a placeholder when the graph is disconnected"""
+        if self.num_ccs != 1:
+            return "N/A (disconnected)"
+        return self._diameter()
+    
+    def _diameter(self):
+        """Exact diameter for small graphs, a two-sweep BFS lower bound for large ones"""
+        if self.graph.number_of_nodes() > DIAMETER_EXACT_MAX_NODES:
+            return nx.approximation.diameter(self.graph, seed=42)
+        return nx.diameter(self.graph)
+    
+    def compute_layout(self):
+        """Force-directed node positions, reused from LAYOUT_CACHE_DIR when the graph is unchanged"""
+        backend = 'networkx' if igraph is None else 'igraph'
+        structure = (
+            backend,
+            sorted(self.graph.nodes()),
+            sorted(tuple(sorted(edge)) for edge in self.graph.edges())
+        )
+        digest = hashlib.sha256(repr(structure).encode()).hexdigest()[:16]
+        cache_path = os.path.join(LAYOUT_CACHE_DIR, f"layout_{digest}.pkl")
+        
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        
+        pos = self._force_layout()
+        os.makedirs(LAYOUT_CACHE_DIR, exist_ok=True)
+        # Layouts of earlier graph versions are never read again
+        for name in os.listdir(LAYOUT_CACHE_DIR):
+            if name.startswith("layout_") and name.endswith(".pkl"):
+                os.remove(os.path.join(LAYOUT_CACHE_DIR, name))
+        with open(cache_path, 'wb') as f:
+            pickle.dump(pos, f)
+        return pos
+    
+    def _force_layout(self):
+        """Force-directed node positions, using igraph's C Fruchterman-Reingold when installed"""
+        if igraph is None:
+            return nx.spring_layout(self.graph, k=3, iterations=50, seed=42)
+        
+        node_ids = list(self.graph.nodes())
+        node_index = {node: i for i, node in enumerate(node_ids)}
+        ig_graph = igraph.Graph(
+            n=len(node_ids),
+            edges=[(node_index[u], node_index[v]) for u, v in self.graph.edges()]
+        )
+        layout = ig_graph.layout_fruchterman_reingold(niter=50)
+        return dict(zip(node_ids, layout.coords))
     
     def create_interactive_network(self):
         """Create interactive network visualization using Plotly"""
-        # Get node positions using spring layout
-        pos = nx.spring_layout(self.graph, k=3, iterations=50)
-        
-        # Create edge traces
-        edge_x = []
-        edge_y = []
-        edge_info = []
-        
-        for edge in self.graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-            
-            # Get edge data
-            edge_data = self.graph[edge[0]][edge[1]]
-            edge_info.append(f"Weight: {edge_data['weight']:.3f}<br>Similarity: {edge_data['similarity']:.3f}")
-        
-        edge_trace = go.Scatter(
+        # Get node positions using a force-directed layout
+        pos = self.compute_layout()
+        
+        # Index node positions so edge endpoints can be gathered in bulk
+        node_ids = list(pos)
+        coords = np.array([pos[node] for node in node_ids], dtype=float).reshape(-1, 2)
+        node_index = {node: i for i, node in enumerate(node_ids)}
+        
+        # Create edge traces: x0, x1, NaN per edge (NaN breaks the polyline between edges)
+        num_edges = self.graph.number_of_edges()
+        edge_index = np.fromiter(
+            (node_index[endpoint] for edge in self.graph.edges() for endpoint in edge),
+            dtype=np.int32, count=2 * num_edges
+        ).reshape(-1, 2)
+        start, end = coords[edge_index[:, 0]], coords[edge_index[:, 1]]
+        
+        edge_x = np.empty(3 * num_edges)
+        edge_x[0::3] = start[:, 0]
+        edge_x[1::3] = end[:, 0]
+        edge_x[2::3] = np.nan
+        
+        edge_y = np.empty(3 * num_edges)
+        edge_y[0::3] = start[:, 1]
+        edge_y[1::3] = end[:, 1]
+        edge_y[2::3] = np.nan
+        
+        # Scattergl renders through WebGL, so pan/zoom stays responsive on large graphs;
+        # all gl traces in a figure share one WebGL context
+        edge_trace = go.Scattergl(
             x=edge_x, y=edge_y,
             line=dict(width=0.5, color='#888'),
             hoverinfo='none',
@@ -137,35 +324,36 @@ class GraphVisualizer:
         node_traces = {}
         colors = {'metric': '#FF6B6B', 'insight': '#4ECDC4'}
         
+        # One pass for per-node type and degree, then each type is a boolean mask
+        degrees = dict(self.graph.degree())
+        node_array = np.array(node_ids, dtype=object)
+        types = np.array([self.graph.nodes[node]['type'] for node in node_ids], dtype=object)
+        
         for node_type in ['metric', 'insight']:
-            node_x = []
-            node_y = []
+            mask = types == node_type
+            members = node_array[mask]
+            node_x = coords[mask, 0]
+            node_y = coords[mask, 1]
+            
+            # Size based on degree centrality
+            node_sizes = 10 + 3 * np.array([degrees[node] for node in members], dtype=float)
+            
             node_text = []
             node_info = []
-            node_sizes = []
+            for node in members:
+                # Node info for hover
+                node_data = self.graph.nodes[node]
+                content = node_data['content']
+                wrapped_content = content if len(content) <= HOVER_WRAP_WIDTH else HOVER_WRAP_RE.sub(r'\1<br>', content)
+                info = (f"Type: {node_data['type']}<br>"
+                       f"Source: {node_data['source']}<br>"
+                       f"Confidence: {node_data['confidence']}<br>"
+                       f"Content: {wrapped_content}<br>"
+                       f"Tags: {', '.join(node_data['tags'])}")
+                node_info.append(info)
+                node_text.append(f"{node_data['source']}")
             
-            for node in self.graph.nodes():
-                if self.graph.nodes[node]['type'] == node_type:
-                    x, y = pos[node]
-                    node_x.append(x)
-                    node_y.append(y)
-                    
-                    # Node info for hover
-                    node_data = self.graph.nodes[node]
-                    wrapped_content = '<br>'.join(textwrap.wrap(node_data['content'], width=50))
-                    info = (f"Type: {node_data['type']}<br>"
-                           f"Source: {node_data['source']}<br>"
-                           f"Confidence: {node_data['confidence']}<br>"
-                           f"Content: {wrapped_content}<br>"
-                           f"Tags: {', '.join(node_data['tags'])}")
-                    node_info.append(info)
-                    node_text.append(f"{node_data['source']}")
-                    
-                    # Size based on degree centrality
-                    degree = self.graph.degree(node)
-                    node_sizes.append(10 + degree * 3)
-            
-            node_traces[node_type] = go.Scatter(
+            node_traces[node_type] = go.Scattergl(
                 x=node_x, y=node_y,
                 mode='markers+text',
                 hoverinfo='text',
@@ -216,42 +404,35 @@ class GraphVisualizer:
         )
         
         # 1. Node Type Distribution (Pie Chart)
-        type_counts = self.nodes_df['type'].value_counts()
+        type_counts = self.type_counts
         fig.add_trace(
             go.Pie(labels=type_counts.index, values=type_counts.values, name="Node Types"),
             row=1, col=1
         )
         
         # 2. Source Distribution (Bar Chart)
-        source_counts = self.nodes_df['source'].value_counts()
+        source_counts = self.source_counts
         fig.add_trace(
             go.Bar(x=source_counts.index, y=source_counts.values, name="Sources"),
             row=1, col=2
         )
         
-        # 3. Connection Strength Distribution (Histogram)
+        # 3. Connection Strength Distribution (binned here so only 20 counts reach the browser)
+        counts, bin_edges = np.histogram(self.edges_df['weight'].to_numpy(), bins=20)
+        bin_centers = 0.5 * (bin_edges[:-1] + bin_edges[1:])
         fig.add_trace(
-            go.Histogram(x=self.edges_df['weight'], name="Edge Weights", nbinsx=20),
+            go.Bar(x=bin_centers, y=counts, width=np.diff(bin_edges), name="Edge Weights"),
             row=2, col=1
         )
         
-        # 4. Node Confidence Levels (Box Plot)
-        confidence_by_type = []
-        types = []
-        for node_type in self.nodes_df['type'].unique():
-            confidence_by_type.extend(self.nodes_df[self.nodes_df['type'] == node_type]['confidence'].tolist())
-            types.extend([node_type] * len(self.nodes_df[self.nodes_df['type'] == node_type]))
-        
+        # 4. Node Confidence Levels (Box Plot, grouped by type in the browser)
         fig.add_trace(
-            go.Box(y=confidence_by_type, x=types, name="Confidence"),
+            go.Box(y=self.nodes_df['confidence'], x=self.nodes_df['type'], name="Confidence"),
             row=2, col=2
         )
         
         # 5. Tag Frequency Analysis
-        all_tags = []
-        for node in self.nodes_data.get('nodes', []):
-            all_tags.extend(node['tags'])
-        tag_counts = Counter(all_tags).most_common(10)
+        tag_counts = self._top_tags
         
         fig.add_trace(
             go.Bar(x=[tag[1] for tag in tag_counts], 
@@ -268,10 +449,10 @@ class GraphVisualizer:
                 self.graph.number_of_nodes(),
                 self.graph.number_of_edges(),
                 f"{2 * self.graph.number_of_edges() / self.graph.number_of_nodes():.2f}",
-                f"{nx.density(self.graph):.3f}",
-                nx.number_connected_components(self.graph),
-                f"{nx.average_clustering(self.graph):.3f}",
-                nx.diameter(self.graph) if nx.is_connected(self.graph) else "N/A (disconnected)"
+                f"{self.density:.3f}",
+                self.num_ccs,
+                f"{self.avg_clustering:.3f}",
+                self.diameter_or_na
             ]
         }
         
@@ -294,26 +475,24 @@ class GraphVisualizer:
     
     def create_relationship_analysis(self):
         """Create detailed relationship strength visualization"""
-        # Calculate node centrality measures
-        degree_centrality = nx.degree_centrality(self.graph)
-        betweenness_centrality = nx.betweenness_centrality(self.graph)
-        closeness_centrality = nx.closeness_centrality(self.graph)
-        
-        # Create centrality DataFrame
-        centrality_data = []
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            centrality_data.append({
-                'node_id': node_id,
-                'content': node_data['content'][:50] + '...',
-                'type': node_data['type'],
-                'source': node_data['source'],
-                'degree_centrality': degree_centrality[node_id],
-                'betweenness_centrality': betweenness_centrality[node_id],
-                'closeness_centrality': closeness_centrality[node_id]
-            })
-        
-        centrality_df = pd.DataFrame(centrality_data)
+        # Node centrality measures (cached on the instance)
+        degree_centrality = self.degree_centrality
+        betweenness_centrality = self.betweenness_centrality
+        closeness_centrality = self.closeness_centrality
+        
+        # Create centrality DataFrame from aligned column arrays
+        ids = list(self.graph.nodes())
+        node_attrs = [self.graph.nodes[node_id] for node_id in ids]
+        num_nodes = len(ids)
+        centrality_df = pd.DataFrame({
+            'node_id': ids,
+            'content': [attrs['content'][:50] + '...' for attrs in node_attrs],
+            'type': [attrs['type'] for attrs in node_attrs],
+            'source': [attrs['source'] for attrs in node_attrs],
+            'degree_centrality': np.fromiter((degree_centrality[n] for n in ids), dtype=np.float64, count=num_nodes),
+            'betweenness_centrality': np.fromiter((betweenness_centrality[n] for n in ids), dtype=np.float64, count=num_nodes),
+            'closeness_centrality': np.fromiter((closeness_centrality[n] for n in ids), dtype=np.float64, count=num_nodes)
+        })
         
         # Create bubble chart for centrality analysis
         fig = px.scatter(
@@ -340,11 +519,11 @@ class GraphVisualizer:
         insights.append(f"📊 **Graph Overview:**")
         insights.append(f"- Total nodes: {self.graph.number_of_nodes()}")
         insights.append(f"- Total edges: {self.graph.number_of_edges()}")
-        insights.append(f"- Graph density: {nx.density(self.graph):.3f}")
+        insights.append(f"- Graph density: {self.density:.3f}")
         insights.append("")
         
         # Node analysis
-        type_counts = self.nodes_df['type'].value_counts()
+        type_counts = self.type_counts
         insights.append(f"🎯 **Node Composition:**")
         for node_type, count in type_counts.items():
             percentage = (count / len(self.nodes_df)) * 100
@@ -352,15 +531,14 @@ class GraphVisualizer:
         insights.append("")
         
         # Source analysis
-        source_counts = self.nodes_df['source'].value_counts()
+        source_counts = self.source_counts
         insights.append(f"📡 **Data Sources:**")
         for source, count in source_counts.items():
             insights.append(f"- {source}: {count} nodes")
         insights.append("")
         
         # Centrality insights
-        degree_centrality = nx.degree_centrality(self.graph)
-        most_connected = max(degree_centrality.items(), key=lambda x: x[1])
+        most_connected = max(self.degree_centrality.items(), key=lambda x: x[1])
         most_connected_node = self.graph.nodes[most_connected[0]]
         
         insights.append(f"🔗 **Key Connections:**")
@@ -370,29 +548,40 @@ class GraphVisualizer:
         
         # Edge strength analysis
         avg_weight = self.edges_df['weight'].mean()
-        strong_edges = len(self.edges_df[self.edges_df['weight'] > avg_weight])
+        strong_edges = int((self.edges_df['weight'] > avg_weight).sum())
         insights.append(f"💪 **Relationship Strength:**")
         insights.append(f"- Average edge weight: {avg_weight:.3f}")
         insights.append(f"- Strong connections (above average): {strong_edges}/{len(self.edges_df)}")
         
         return "\n".join(insights)
     
+    def _write_figure(self, build, path):
+        """Build a figure and write it to an HTML file"""
+        build().write_html(path, **WRITE_HTML_OPTIONS)
+    
     def save_visualizations(self, output_dir="visualizations"):
         """Save all visualizations to HTML files"""
-        import os
         os.makedirs(output_dir, exist_ok=True)
         
-        # Interactive Network
-        network_fig = self.create_interactive_network()
-        network_fig.write_html(f"{output_dir}/network_graph.html")
-        
-        # Analytics Dashboard
-        dashboard_fig = self.create_analytics_dashboard()
-        dashboard_fig.write_html(f"{output_dir}/analytics_dashboard.html")
-        
-        # Relationship Analysis
-        relationship_fig = self.create_relationship_analysis()
-        relationship_fig.write_html(f"{output_dir}/relationship_analysis.html")
+        # Fill the shared metric caches up front so the figure threads only read them
+        for metric in ('type_counts', 'source_counts', 'degree_centrality', 'betweenness_centrality',
+                       'closeness_centrality', 'density', 'avg_clustering', 'diameter_or_na'):
+            getattr(self, metric)
+        
+        # Network graph, analytics dashboard and relationship analysis are independent,
+        # so build and write them concurrently
+        figures = {
+            'network_graph': self.create_interactive_network,
+            'analytics_dashboard': self.create_analytics_dashboard,
+            'relationship_analysis': self.create_relationship_analysis
+        }
+        with ThreadPoolExecutor(max_workers=len(figures)) as executor:
+            futures = [
+                executor.submit(self._write_figure, build, f"{output_dir}/{name}.html")
+                for name, build in figures.items()
+            ]
+            for future in futures:
+                future.result()
         
         # Save insights report
         insights = self.generate_insights_report()